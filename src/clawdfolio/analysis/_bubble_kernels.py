@@ -0,0 +1,76 @@
+"""Numeric kernels for the bubble risk score.
+
+Kernels take float64 ndarrays and are JIT-compiled with numba when the
+``performance`` extra is installed; otherwise they run as plain NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._njit import njit
+
+TRADING_DAYS_YEAR = 252
+
+
+@njit(cache=True)
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a cumulative sum, one value per full window."""
+    if values.shape[0] < window:
+        return np.empty(0, dtype=np.float64)
+    csum = np.empty(values.shape[0] + 1, dtype=np.float64)
+    csum[0] = 0.0
+    csum[1:] = np.cumsum(values)
+    return (csum[window:] - csum[:-window]) / window
+
+
+@njit(cache=True)
+def rolling_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Rolling Pearson correlation of two aligned series from running sums.
+
+    Returns one value per full window; zero-variance windows yield NaN/inf.
+    """
+    n = x.shape[0]
+    if n < window:
+        return np.empty(0, dtype=np.float64)
+    sums = np.zeros((5, n + 1), dtype=np.float64)
+    sums[0, 1:] = np.cumsum(x)
+    sums[1, 1:] = np.cumsum(y)
+    sums[2, 1:] = np.cumsum(x * y)
+    sums[3, 1:] = np.cumsum(x * x)
+    sums[4, 1:] = np.cumsum(y * y)
+    win = (sums[:, window:] - sums[:, :-window]) / window
+    mean_x, mean_y, mean_xy, mean_xx, mean_yy = win[0], win[1], win[2], win[3], win[4]
+    cov = mean_xy - mean_x * mean_y
+    var_x = np.maximum(mean_xx - mean_x * mean_x, 0.0)
+    var_y = np.maximum(mean_yy - mean_y * mean_y, 0.0)
+    corr: np.ndarray = cov / np.sqrt(var_x * var_y)
+    return corr
+
+
+@njit(cache=True)
+def sma_deviation(prices: np.ndarray, window: int) -> float:
+    """Last price deviation from its ``window``-day SMA, as percentage."""
+    n = prices.shape[0]
+    if n < window:
+        return 0.0
+    sma = prices[n - window :].mean()
+    if sma == 0:
+        return 0.0
+    return float((prices[n - 1] - sma) / sma * 100)
+
+
+@njit(cache=True)
+def trend_acceleration(prices: np.ndarray, weights: np.ndarray) -> float:
+    """Quadratic log-price coefficient over the last ``len(weights)`` bars, x1e4."""
+    window = weights.shape[0]
+    log_prices = np.log(prices[prices.shape[0] - window :])
+    return float(np.dot(weights, log_prices)) * 10000
+
+
+@njit(cache=True)
+def volatility_regime(prices: np.ndarray, window: int) -> float:
+    """Annualised realised volatility over the last ``window`` returns."""
+    log_tail = np.log(prices[prices.shape[0] - window - 1 :])
+    log_ret = log_tail[1:] - log_tail[:-1]
+    return float(np.std(log_ret) * np.sqrt(TRADING_DAYS_YEAR))
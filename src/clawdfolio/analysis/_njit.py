@@ -0,0 +1,38 @@
+"""Optional numba support for analysis kernels.
+
+``njit`` and ``prange`` come from numba when the ``performance`` extra is
+installed and degrade to a no-op decorator and ``range`` otherwise, so
+kernels must stick to operations numba's nopython mode supports.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+if TYPE_CHECKING:
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]: ...
+
+    prange = range
+
+else:
+    try:
+        from numba import njit, prange
+    except ImportError:  # pragma: no cover - numba is optional
+        prange = range
+
+        def njit(*args: Any, **kwargs: Any) -> Any:
+            """No-op stand-in for ``numba.njit`` when numba is unavailable."""
+            if len(args) == 1 and callable(args[0]):
+                return args[0]
+
+            def decorator(fn: _F) -> _F:
+                return fn
+
+            return decorator
+
+
+__all__ = ["njit", "prange"]
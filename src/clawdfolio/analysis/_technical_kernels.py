@@ -0,0 +1,88 @@
+"""Numeric kernels for technical indicators.
+
+Kernels take float64 ndarrays and are JIT-compiled with numba when the
+``performance`` extra is installed; otherwise they run as plain NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._njit import njit, prange
+
+
+@njit(cache=True)
+def cross_means(prices: np.ndarray, fast: int, slow: int) -> tuple[float, float, float, float]:
+    """Fast and slow SMAs on the bar before the last and on the last bar.
+
+    Returns ``(fast_prev, fast_curr, slow_prev, slow_curr)``. When the fast
+    window is a suffix of the slow one its running sum is reused for the slow
+    sum, and each current window is the previous one slid by one element.
+    ``prices`` needs at least ``slow + 1`` values.
+    """
+    n = prices.shape[0]
+    last = prices[n - 1]
+    fast_sum = prices[n - fast - 1 : n - 1].sum()
+    if fast <= slow:
+        slow_sum = prices[n - slow - 1 : n - fast - 1].sum() + fast_sum
+    else:
+        slow_sum = prices[n - slow - 1 : n - 1].sum()
+    return (
+        fast_sum / fast,
+        (fast_sum + last - prices[n - fast - 1]) / fast,
+        slow_sum / slow,
+        (slow_sum + last - prices[n - slow - 1]) / slow,
+    )
+
+
+@njit(cache=True, parallel=True)
+def cross_signals(prices: np.ndarray, fast: int, slow: int) -> tuple[np.ndarray, np.ndarray]:
+    """Golden / death cross flags for each row of a (tickers, days) price matrix.
+
+    Compares the fast and slow SMAs on the last bar against the bar before.
+    Rows must share a common length of at least ``slow + 1``.
+    """
+    n_rows = prices.shape[0]
+    golden = np.zeros(n_rows, dtype=np.bool_)
+    death = np.zeros(n_rows, dtype=np.bool_)
+    for i in prange(n_rows):
+        fast_prev, fast_curr, slow_prev, slow_curr = cross_means(prices[i], fast, slow)
+        golden[i] = fast_prev <= slow_prev and fast_curr > slow_curr
+        death[i] = fast_prev >= slow_prev and fast_curr < slow_curr
+    return golden, death
+
+
+@njit(cache=True)
+def rsi(prices: np.ndarray, period: int) -> np.ndarray:
+    """RSI series with Wilder smoothing, in one pass over ``prices``.
+
+    Reproduces ``ewm(alpha=1/period, min_periods=period).mean()`` of gains
+    and losses (adjusted weights). The first ``period - 1`` values are NaN;
+    no losses gives 100 and no movement at all gives 50.
+    """
+    n = prices.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / period
+    sum_gain = 0.0
+    sum_loss = 0.0
+    weight = 0.0
+    for i in range(n):
+        gain = 0.0
+        loss = 0.0
+        if i > 0:
+            delta = prices[i] - prices[i - 1]
+            if delta > 0:
+                gain = delta
+            elif delta < 0:
+                loss = -delta
+        sum_gain = gain + decay * sum_gain
+        sum_loss = loss + decay * sum_loss
+        weight = 1.0 + decay * weight
+        if i >= period - 1:
+            avg_gain = sum_gain / weight
+            avg_loss = sum_loss / weight
+            if avg_loss == 0:
+                out[i] = 50.0 if avg_gain == 0 else 100.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
+import threading
 import warnings
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from . import _bubble_kernels as _kernels
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is optional
+    import json as _json  # type: ignore[no-redef]
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +36,14 @@ LIQUIDITY_WEIGHT = 0.4
 
 DANGER_THRESHOLD = 85
 
+# Daily on-disk cache for downloaded price / FRED history
+CACHE_DIR = Path("~/.cache/clawdfolio/bubble").expanduser()
+
+_FrameT = TypeVar("_FrameT", pd.DataFrame, pd.Series)
+
+# In-process layer over the disk cache: key -> (day stored, data)
+_memory_cache: dict[str, tuple[date, Any]] = {}
+
 
 @dataclass
 class IndicatorResult:
@@ -48,36 +68,163 @@ class BubbleIndexResult:
     timestamp: str = ""
 
 
-def _percentile_rank(value: float, history: pd.Series) -> float:
-    """Compute percentile rank of value within history, scaled 0-100."""
-    clean = history.dropna()
-    if clean.empty:
+def _sorted_history(history: pd.Series | np.ndarray) -> np.ndarray:
+    """Drop NaNs and sort history once for repeated percentile lookups."""
+    values = np.asarray(history, dtype=np.float64)
+    return np.sort(values[~np.isnan(values)])
+
+
+def _percentile_rank(value: float, history_sorted: np.ndarray) -> float:
+    """Compute percentile rank of value within sorted history, scaled 0-100.
+
+    ``history_sorted`` must be NaN-free and ascending (see ``_sorted_history``);
+    the rank is then a binary search rather than a full scan.
+    """
+    if history_sorted.size == 0:
         return 50.0
-    return float((clean < value).sum() / len(clean) * 100)
+    idx = np.searchsorted(history_sorted, value, side="left")
+    return float(idx / history_sorted.size * 100)
+
+
+def _memory_get(key: str) -> Any:
+    """Return the in-process copy of ``key`` if it was stored today."""
+    hit = _memory_cache.get(key)
+    if hit is not None and hit[0] == date.today():
+        return hit[1]
+    return None
 
 
-def _safe_download(ticker: str, period: str = "5y") -> pd.DataFrame:
-    """Download yfinance data with error handling."""
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / (re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".pkl")
+
+
+def _write_cache(path: Path, data: pd.DataFrame | pd.Series) -> None:
+    """Atomically pickle ``data`` to ``path``; failures are logged and ignored."""
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            df = yf.download(ticker, period=period, progress=False)
-        if df is None or df.empty:
-            return pd.DataFrame()
-        return df
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        data.to_pickle(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        logger.debug("Failed to write cache file %s", path, exc_info=True)
+
+
+def _disk_cached(key: str, fetch: Callable[[], _FrameT]) -> _FrameT:
+    """Return today's on-disk copy of ``key`` if present, else fetch and store it.
+
+    Daily history only changes at the tail, so a file written today is
+    treated as fresh. Empty results are never cached; cache I/O errors
+    fall through to a live fetch.
+    """
+    hit = _memory_get(key)
+    if hit is not None:
+        return hit  # type: ignore[no-any-return]
+
+    path = _cache_path(key)
+    try:
+        if date.fromtimestamp(path.stat().st_mtime) == date.today():
+            data = pd.read_pickle(path)
+            _memory_cache[key] = (date.today(), data)
+            return data  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        pass
     except Exception:
-        logger.warning("Failed to download %s", ticker)
-        return pd.DataFrame()
+        logger.debug("Ignoring unreadable cache file %s", path, exc_info=True)
 
+    data = fetch()
+    if data is not None and not data.empty:
+        _write_cache(path, data)
+        _memory_cache[key] = (date.today(), data)
+    return data
 
-def _get_close(df: pd.DataFrame) -> pd.Series:
-    """Extract Close as a Series, handling yfinance 1.1.0 DataFrame quirk."""
+
+@lru_cache(maxsize=4)
+def _fred_client(api_key: str) -> Any:
+    """Shared ``fredapi.Fred`` client per API key; raises ImportError without fredapi."""
+    from fredapi import Fred
+
+    return Fred(api_key=api_key)
+
+
+def _fred_series(fred: Any, series_id: str) -> pd.Series:
+    """Fetch a FRED series, downloading only observations newer than the cache.
+
+    FRED series are append-only, so the full history is kept on disk and
+    extended with ``observation_start`` on later days. If the refresh fails
+    the cached history is returned as-is.
+    """
+    key = f"fred_{series_id}"
+    hit = _memory_get(key)
+    if hit is not None:
+        return hit  # type: ignore[no-any-return]
+
+    path = _cache_path(key)
+    cached: pd.Series | None = None
+    try:
+        cached = pd.read_pickle(path)
+        if date.fromtimestamp(path.stat().st_mtime) == date.today():
+            _memory_cache[key] = (date.today(), cached)
+            return cached
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug("Ignoring unreadable cache file %s", path, exc_info=True)
+
+    if cached is None or cached.empty:
+        data = fred.get_series(series_id)
+    else:
+        last = cached.index[-1]
+        if last >= pd.Timestamp.today().normalize() - pd.offsets.BDay(1):
+            _memory_cache[key] = (date.today(), cached)
+            return cached
+        try:
+            tail = fred.get_series(series_id, observation_start=last + pd.Timedelta(days=1))
+        except Exception:
+            logger.warning("Failed to refresh %s from FRED — using cached series", series_id)
+            return cached
+        data = cached if tail is None or tail.empty else pd.concat([cached, tail])
+        data = data[~data.index.duplicated(keep="last")]
+
+    if data is not None and not data.empty:
+        _write_cache(path, data)
+        _memory_cache[key] = (date.today(), data)
+    return data
+
+
+def _safe_download(ticker: str | list[str], period: str = "5y") -> pd.DataFrame:
+    """Download yfinance data with error handling.
+
+    Passing a list of tickers fetches them all in a single request.
+    Results are cached on disk for the rest of the day.
+    """
+    tickers = ticker if isinstance(ticker, str) else " ".join(ticker)
+
+    def _fetch() -> pd.DataFrame:
+        import yfinance as yf
+
+        from ..market.data import download
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                df = download(yf, ticker, period=period, progress=False)
+            if df is None or df.empty:
+                return pd.DataFrame()
+            return df
+        except Exception:
+            logger.warning("Failed to download %s", tickers)
+            return pd.DataFrame()
+
+    return _disk_cached(f"yf_{tickers}_{period}", _fetch)
+
+
+def _get_close_array(df: pd.DataFrame) -> np.ndarray:
+    """Extract Close as a NaN-free float64 array, for callers that need no dates."""
     if df.empty:
-        return pd.Series(dtype=float)
-    close = df["Close"]
-    if isinstance(close, pd.DataFrame):
-        close = close.squeeze()
-    return close.dropna()
+        return np.empty(0, dtype=np.float64)
+    values: np.ndarray = df["Close"].to_numpy(dtype=np.float64).ravel()
+    clean: np.ndarray = values[~np.isnan(values)]
+    return clean
 
 
 # ── Indicator 1: QQQ 200D Deviation ──────────────────────────────────────
@@ -86,18 +233,17 @@ def _get_close(df: pd.DataFrame) -> pd.Series:
 def calc_qqq_deviation(lookback_years: int = 5) -> IndicatorResult | None:
     """QQQ deviation from 200-day SMA, normalized via percentile."""
     df = _safe_download("QQQ", period=f"{lookback_years}y")
-    close = _get_close(df)
-    if len(close) < 200:
+    values = _get_close_array(df)
+    if values.size < 200:
         return None
 
-    sma200 = close.rolling(200).mean()
-    deviation = (close - sma200) / sma200
-    deviation = deviation.dropna()
-    if deviation.empty:
+    sma200 = _kernels.sma(values, 200)
+    deviation = (values[199:] - sma200) / sma200
+    if deviation.size == 0:
         return None
 
-    current = float(deviation.iloc[-1])
-    pct = _percentile_rank(current, deviation)
+    current = float(deviation[-1])
+    pct = _percentile_rank(current, _sorted_history(deviation))
 
     return IndicatorResult(
         name="QQQ 200D Deviation",
@@ -113,20 +259,19 @@ def calc_qqq_deviation(lookback_years: int = 5) -> IndicatorResult | None:
 
 def calc_put_call_ratio(lookback_years: int = 5) -> IndicatorResult | None:
     """CBOE equity put/call ratio from FRED. Inverted: low P/C = high bubble risk."""
-    try:
-        from fredapi import Fred
-    except ImportError:
-        logger.warning("fredapi not installed — skipping Put/Call ratio indicator")
-        return None
-
     api_key = os.environ.get("FRED_API_KEY")
     if not api_key:
         logger.warning("FRED_API_KEY not set — skipping Put/Call ratio indicator")
         return None
 
     try:
-        fred = Fred(api_key=api_key)
-        data = fred.get_series("PCCE")
+        fred = _fred_client(api_key)
+    except ImportError:
+        logger.warning("fredapi not installed — skipping Put/Call ratio indicator")
+        return None
+
+    try:
+        data = _fred_series(fred, "PCCE")
     except Exception:
         logger.warning("Failed to fetch PCCE from FRED")
         return None
@@ -136,7 +281,7 @@ def calc_put_call_ratio(lookback_years: int = 5) -> IndicatorResult | None:
 
     end = pd.Timestamp.now()
     start = end - pd.DateOffset(years=lookback_years)
-    data = data.loc[start:]
+    data = data.iloc[data.index.searchsorted(start) :]
     data = data.dropna()
 
     if data.empty:
@@ -144,7 +289,7 @@ def calc_put_call_ratio(lookback_years: int = 5) -> IndicatorResult | None:
 
     current = float(data.iloc[-1])
     # Invert: low P/C = bullish = higher bubble risk
-    pct = _percentile_rank(current, data)
+    pct = _percentile_rank(current, _sorted_history(data))
     inverted_score = 100.0 - pct
 
     return IndicatorResult(
@@ -162,12 +307,12 @@ def calc_put_call_ratio(lookback_years: int = 5) -> IndicatorResult | None:
 def calc_vix_level(lookback_years: int = 5) -> IndicatorResult | None:
     """VIX level — inverted: low VIX = complacency = higher bubble risk."""
     df = _safe_download("^VIX", period=f"{lookback_years}y")
-    close = _get_close(df)
-    if close.empty:
+    close = _get_close_array(df)
+    if close.size == 0:
         return None
 
-    current = float(close.iloc[-1])
-    pct = _percentile_rank(current, close)
+    current = float(close[-1])
+    pct = _percentile_rank(current, np.sort(close))
     inverted_score = 100.0 - pct
 
     return IndicatorResult(
@@ -187,16 +332,22 @@ def calc_sector_breadth(lookback_years: int = 1) -> IndicatorResult | None:
     above_count = 0
     total = 0
 
-    for etf in SECTOR_ETFS:
-        df = _safe_download(etf, period=f"{max(lookback_years, 2)}y")
-        close = _get_close(df)
-        if len(close) < 200:
-            continue
-        sma200 = close.rolling(200).mean().dropna()
-        if sma200.empty:
+    # One batched download for all sectors instead of a round-trip per ETF
+    df = _safe_download(SECTOR_ETFS, period=f"{max(lookback_years, 2)}y")
+    if df.empty:
+        return None
+    closes = df["Close"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame()
+
+    for etf in closes.columns:
+        close = closes[etf].to_numpy(dtype=np.float64)
+        close = close[~np.isnan(close)]
+        if close.size < 200:
             continue
+        # Only the latest SMA value matters here, so average the tail directly
         total += 1
-        if float(close.iloc[-1]) > float(sma200.iloc[-1]):
+        if float(close[-1]) > float(close[-200:].mean()):
             above_count += 1
 
     if total == 0:
@@ -219,32 +370,27 @@ def calc_sector_breadth(lookback_years: int = 1) -> IndicatorResult | None:
 
 def calc_credit_spread(lookback_years: int = 2) -> IndicatorResult | None:
     """HYG/IEF rolling 60d return correlation as credit spread proxy."""
-    hyg = _safe_download("HYG", period=f"{lookback_years}y")
-    ief = _safe_download("IEF", period=f"{lookback_years}y")
-
-    hyg_close = _get_close(hyg)
-    ief_close = _get_close(ief)
-
-    if len(hyg_close) < 61 or len(ief_close) < 61:
+    # One batched download; yfinance aligns both tickers on a shared date index
+    df = _safe_download(["HYG", "IEF"], period=f"{lookback_years}y")
+    if df.empty:
         return None
-
-    hyg_ret = hyg_close.pct_change().dropna()
-    ief_ret = ief_close.pct_change().dropna()
-
-    # Align on common dates
-    common = hyg_ret.index.intersection(ief_ret.index)
-    if len(common) < 61:
+    closes = df["Close"]
+    if isinstance(closes, pd.Series) or not {"HYG", "IEF"} <= set(closes.columns):
         return None
 
-    hyg_ret = hyg_ret.loc[common]
-    ief_ret = ief_ret.loc[common]
+    prices = closes[["HYG", "IEF"]].dropna().to_numpy(dtype=np.float64)
+    if prices.shape[0] < 62:
+        return None
+    returns = np.diff(prices, axis=0) / prices[:-1]
 
-    corr = hyg_ret.rolling(60).corr(ief_ret).dropna()
-    if corr.empty:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = _kernels.rolling_corr(returns[:, 0], returns[:, 1], 60)
+    corr = corr[np.isfinite(corr)]
+    if corr.size == 0:
         return None
 
-    current = float(corr.iloc[-1])
-    pct = _percentile_rank(current, corr)
+    current = float(corr[-1])
+    pct = _percentile_rank(current, _sorted_history(corr))
     # High correlation = tight spreads = risk-on = higher bubble risk
     score = pct
 
@@ -262,20 +408,19 @@ def calc_credit_spread(lookback_years: int = 2) -> IndicatorResult | None:
 
 def calc_yield_curve(lookback_years: int = 5) -> IndicatorResult | None:
     """10Y-2Y yield spread from FRED. Normal/steep curve = risk-on = higher bubble risk."""
-    try:
-        from fredapi import Fred
-    except ImportError:
-        logger.warning("fredapi not installed — skipping Yield Curve indicator")
-        return None
-
     api_key = os.environ.get("FRED_API_KEY")
     if not api_key:
         logger.warning("FRED_API_KEY not set — skipping Yield Curve indicator")
         return None
 
     try:
-        fred = Fred(api_key=api_key)
-        data = fred.get_series("T10Y2Y")
+        fred = _fred_client(api_key)
+    except ImportError:
+        logger.warning("fredapi not installed — skipping Yield Curve indicator")
+        return None
+
+    try:
+        data = _fred_series(fred, "T10Y2Y")
     except Exception:
         logger.warning("Failed to fetch T10Y2Y from FRED")
         return None
@@ -285,14 +430,14 @@ def calc_yield_curve(lookback_years: int = 5) -> IndicatorResult | None:
 
     end = pd.Timestamp.now()
     start = end - pd.DateOffset(years=lookback_years)
-    data = data.loc[start:]
+    data = data.iloc[data.index.searchsorted(start) :]
     data = data.dropna()
 
     if data.empty:
         return None
 
     current = float(data.iloc[-1])
-    pct = _percentile_rank(current, data)
+    pct = _percentile_rank(current, _sorted_history(data))
     # Positive/steep = risk-on = higher bubble risk
     score = pct
 
@@ -309,7 +454,7 @@ def calc_yield_curve(lookback_years: int = 5) -> IndicatorResult | None:
 
 
 def _classify_regime(score: float) -> str:
-    """Classify bubble regime based on composite score."""
+    """Classify bubble regime based on composite score (NaN reads as NORMAL)."""
     if score >= DANGER_THRESHOLD:
         return "DANGER"
     if score >= 60:
@@ -335,18 +480,34 @@ def calculate_bubble_index(
     Returns:
         BubbleIndexResult with composite, sentiment, and liquidity scores.
     """
-    # Sentiment indicators: (calc_func, weight_within_sentiment, kwargs)
+    now = datetime.now()
+
+    # Every indicator is network-bound (yfinance / FRED), so fetch them
+    # concurrently; total wall time is then the slowest single fetch.
+    jobs: dict[str, Callable[[], IndicatorResult | None]] = {
+        "qqq_deviation": lambda: calc_qqq_deviation(lookback_years=qqq_lookback),
+        "put_call_ratio": lambda: calc_put_call_ratio(lookback_years=put_call_lookback),
+        "vix_level": lambda: calc_vix_level(lookback_years=vix_lookback),
+        "sector_breadth": lambda: calc_sector_breadth(lookback_years=breadth_lookback),
+        "credit_spread": lambda: calc_credit_spread(lookback_years=credit_lookback),
+        "yield_curve": lambda: calc_yield_curve(lookback_years=yield_curve_lookback),
+    }
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {key: executor.submit(fn) for key, fn in jobs.items()}
+        results = {key: fut.result() for key, fut in futures.items()}
+
+    # Sentiment indicators: (key, weight_within_sentiment, result)
     sentiment_specs: list[tuple[str, float, IndicatorResult | None]] = [
-        ("qqq_deviation", 0.30, calc_qqq_deviation(lookback_years=qqq_lookback)),
-        ("put_call_ratio", 0.25, calc_put_call_ratio(lookback_years=put_call_lookback)),
-        ("vix_level", 0.20, calc_vix_level(lookback_years=vix_lookback)),
-        ("sector_breadth", 0.25, calc_sector_breadth(lookback_years=breadth_lookback)),
+        ("qqq_deviation", 0.30, results["qqq_deviation"]),
+        ("put_call_ratio", 0.25, results["put_call_ratio"]),
+        ("vix_level", 0.20, results["vix_level"]),
+        ("sector_breadth", 0.25, results["sector_breadth"]),
     ]
 
     # Liquidity indicators
     liquidity_specs: list[tuple[str, float, IndicatorResult | None]] = [
-        ("credit_spread", 0.50, calc_credit_spread(lookback_years=credit_lookback)),
-        ("yield_curve", 0.50, calc_yield_curve(lookback_years=yield_curve_lookback)),
+        ("credit_spread", 0.50, results["credit_spread"]),
+        ("yield_curve", 0.50, results["yield_curve"]),
     ]
 
     indicators: dict[str, IndicatorResult] = {}
@@ -375,7 +536,7 @@ def calculate_bubble_index(
         liquidity_score=round(liquidity_score, 2),
         indicators=indicators,
         regime=_classify_regime(composite),
-        timestamp=datetime.now().isoformat(timespec="seconds"),
+        timestamp=now.isoformat(timespec="seconds"),
     )
 
 
@@ -424,34 +585,48 @@ class BubbleRiskResult:
         return 0.20  # income mode (when manually overriding)
 
 
-def _sma200_deviation(prices: pd.Series) -> float:
+def _risk_regime(score: float) -> str:
+    """Map a drawdown risk score to its regime label (NaN reads as low_risk)."""
+    if score >= 66:
+        return "high_risk"
+    if score >= 55:
+        return "elevated"
+    if score >= 40:
+        return "moderate"
+    return "low_risk"
+
+
+def _sma200_deviation(prices: pd.Series | np.ndarray) -> float:
     """Current price deviation from 200-day SMA, as percentage."""
-    if len(prices) < 200:
-        return 0.0
-    sma200 = float(prices.rolling(200).mean().iloc[-1])
-    current = float(prices.iloc[-1])
-    if sma200 == 0:
-        return 0.0
-    return (current - sma200) / sma200 * 100
+    return _kernels.sma_deviation(np.asarray(prices, dtype=np.float64), 200)
+
+
+@lru_cache(maxsize=8)
+def _quadratic_weights(window: int) -> np.ndarray:
+    """Least-squares weights giving the x² coefficient of a fit over ``arange(window)``.
+
+    The design matrix is fixed for a given window, so its pseudo-inverse row
+    is computed once and each fit collapses to a single dot product.
+    """
+    vander = np.vander(np.arange(window, dtype=np.float64), 3)
+    weights: np.ndarray = np.linalg.pinv(vander)[0]
+    return weights
 
 
-def _trend_acceleration(prices: pd.Series, window: int = 60) -> float:
+def _trend_acceleration(prices: pd.Series | np.ndarray, window: int = 60) -> float:
     """Measure how sharply prices are accelerating above trend."""
     if len(prices) < window + 20:
         return 0.0
-    log_prices = np.log(prices.values[-window:])
-    x = np.arange(window)
-    coeffs = np.polyfit(x, log_prices, 2)
-    return float(coeffs[0]) * 10000
+    return _kernels.trend_acceleration(
+        np.asarray(prices, dtype=np.float64), _quadratic_weights(window)
+    )
 
 
-def _volatility_regime(prices: pd.Series, window: int = 20) -> float:
+def _volatility_regime(prices: pd.Series | np.ndarray, window: int = 20) -> float:
     """Annualised realised volatility."""
     if len(prices) < window + 1:
         return 0.5
-    log_ret = np.log(prices.values[1:] / prices.values[:-1])
-    vol = float(np.std(log_ret[-window:]) * np.sqrt(252))
-    return vol
+    return _kernels.volatility_regime(np.asarray(prices, dtype=np.float64), window)
 
 
 def calculate_bubble_risk(
@@ -468,57 +643,54 @@ def calculate_bubble_risk(
     For the full model with GSADF / Markov regime detection,
     use ``fetch_bubble_risk()`` which reads from the Dashboard API.
     """
+    now = datetime.now()
     df = _safe_download(ticker, period=period)
-    close = _get_close(df)
-    if close.empty or len(close) < 200:
+    prices = _get_close_array(df)
+    if prices.size < 200:
         logger.warning("Insufficient data for %s — returning neutral score", ticker)
         return BubbleRiskResult(
             drawdown_risk_score=50.0,
             composite_score=50.0,
             regime="moderate",
-            date=datetime.now().strftime("%Y-%m-%d"),
+            date=now.strftime("%Y-%m-%d"),
+            timestamp=now,
         )
 
-    prices = close
-
     # Component 1: SMA-200 deviation (0-40 pts)
     dev = _sma200_deviation(prices)
-    dev_score = np.clip(dev / 30 * 40, 0, 40)
+    dev_score = max(0.0, min(40.0, dev / 30 * 40))
 
     # Component 2: Trend acceleration (0-30 pts)
     accel = _trend_acceleration(prices)
-    accel_score = np.clip(accel / 5 * 30, 0, 30)
+    accel_score = max(0.0, min(30.0, accel / 5 * 30))
 
     # Component 3: Volatility regime (0-30 pts)
     vol = _volatility_regime(prices)
-    vol_score = np.clip((vol - 0.20) / 0.50 * 30, 0, 30)
+    vol_score = max(0.0, min(30.0, (vol - 0.20) / 0.50 * 30))
 
-    composite = float(dev_score + accel_score + vol_score)
-    composite = np.clip(composite, 0, 100)
+    composite = max(0.0, min(100.0, dev_score + accel_score + vol_score))
     drawdown_risk = composite
 
-    if drawdown_risk >= 66:
-        regime = "high_risk"
-    elif drawdown_risk >= 55:
-        regime = "elevated"
-    elif drawdown_risk >= 40:
-        regime = "moderate"
-    else:
-        regime = "low_risk"
+    regime = _risk_regime(drawdown_risk)
 
     return BubbleRiskResult(
         drawdown_risk_score=round(drawdown_risk, 1),
         composite_score=round(composite, 1),
         regime=regime,
-        date=datetime.now().strftime("%Y-%m-%d"),
+        date=now.strftime("%Y-%m-%d"),
+        timestamp=now,
         components={
-            "sma200_deviation": round(float(dev_score), 1),
-            "trend_acceleration": round(float(accel_score), 1),
-            "volatility_regime": round(float(vol_score), 1),
+            "sma200_deviation": round(dev_score, 1),
+            "trend_acceleration": round(accel_score, 1),
+            "volatility_regime": round(vol_score, 1),
         },
     )
 
 
+# Dashboard readings keyed by (url, UTC date); the pipeline publishes daily
+_fetch_cache: dict[tuple[str, str], BubbleRiskResult] = {}
+
+
 def fetch_bubble_risk(
     url: str = _DEFAULT_BUBBLE_HISTORY_URL,
 ) -> BubbleRiskResult:
@@ -526,12 +698,20 @@ def fetch_bubble_risk(
 
     Returns the full model output (GSADF + Markov + deviation +
     regime detection) computed by the Dashboard's daily pipeline.
+    Successful readings are reused for the rest of the UTC day.
     """
+    now_utc = datetime.now(timezone.utc)
+    now = now_utc.astimezone().replace(tzinfo=None)
+    cache_key = (url, now_utc.date().isoformat())
+    cached = _fetch_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         import urllib.request
 
         with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
+            data = _json.loads(resp.read())
     except Exception:
         logger.warning("Failed to fetch from Dashboard API — falling back to live calc")
         return calculate_bubble_risk()
@@ -543,21 +723,17 @@ def fetch_bubble_risk(
     latest = history[-1]
     risk = latest.get("drawdown_risk_score", 50.0)
     composite = latest.get("composite_score", 50.0)
-    date = latest.get("date", datetime.now().strftime("%Y-%m-%d"))
-
-    if risk >= 66:
-        regime = "high_risk"
-    elif risk >= 55:
-        regime = "elevated"
-    elif risk >= 40:
-        regime = "moderate"
-    else:
-        regime = "low_risk"
+    reading_date = latest.get("date", now.strftime("%Y-%m-%d"))
 
-    return BubbleRiskResult(
+    regime = _risk_regime(risk)
+
+    result = BubbleRiskResult(
         drawdown_risk_score=risk,
         composite_score=composite,
         regime=regime,
-        date=date,
+        date=reading_date,
         components=latest.get("components", {}),
+        timestamp=now,
     )
+    _fetch_cache[cache_key] = result
+    return result
@@ -201,7 +201,8 @@ def analyze_concentration(
         "sectors": sectors,
         "alerts": alerts,
         "is_concentrated": len(alerts) > 0,
-        "effective_n": effective_n([p.weight for p in portfolio.positions]),
+        # Same sum of squared weights as effective_n(), already computed above
+        "effective_n": 1.0 / metrics.hhi if metrics.hhi > 0 else 0.0,
         "n_positions": len(portfolio.positions),
     }
 
@@ -5,11 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from ..core.types import Portfolio
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """A historical or hypothetical stress scenario."""
 
@@ -17,7 +19,7 @@ class Scenario:
     moves: dict[str, float]  # benchmark ticker -> return (e.g., -0.34 for -34%)
 
 
-@dataclass
+@dataclass(slots=True)
 class StressResult:
     """Result of a single stress scenario on the portfolio."""
 
@@ -100,6 +102,8 @@ def stress_test_portfolio(
     For each position, the estimated impact is:
         position_weight * leverage_factor * scenario_benchmark_move
 
+    All scenarios are evaluated together as one (scenario x position) array.
+
     Args:
         portfolio: Portfolio object
         scenarios: List of scenarios to test (defaults to built-in SCENARIOS)
@@ -113,38 +117,52 @@ def stress_test_portfolio(
     if not portfolio.positions:
         return []
 
+    # Struct-of-arrays view of the positions, built once for all scenarios
+    positions = portfolio.positions
+    tickers = [pos.symbol.ticker for pos in positions]
+    weights = np.array([pos.weight for pos in positions], dtype=np.float64)
+    leverages = np.array([_get_leverage_factor(t) for t in tickers], dtype=np.float64)
+    benchmarks = [_get_benchmark(t) for t in tickers]
+    bench_names = sorted(set(benchmarks))
+    bench_idx = np.array([bench_names.index(b) for b in benchmarks], dtype=np.intp)
+
+    # (scenarios, benchmarks) move matrix; unknown benchmarks follow SPY
+    scenario_moves = np.empty((len(scenarios), len(bench_names)), dtype=np.float64)
+    for i, scenario in enumerate(scenarios):
+        moves = scenario.moves
+        default = moves.get("SPY", -0.10)
+        scenario_moves[i] = [moves.get(b, default) for b in bench_names]
+    bench_moves = scenario_moves[:, bench_idx]
+    impacts = (weights * leverages)[np.newaxis, :] * bench_moves
+    totals = impacts.sum(axis=1)
+
+    weight_list = weights.tolist()
+    leverage_list = leverages.tolist()
     results = []
-
-    for scenario in scenarios:
-        total_impact = 0.0
-        position_impacts: list[dict[str, float | str]] = []
-
-        for pos in portfolio.positions:
-            ticker = pos.symbol.ticker
-            weight = pos.weight
-            leverage = _get_leverage_factor(ticker)
-            benchmark = _get_benchmark(ticker)
-
-            # Use the scenario move for the position's benchmark
-            bench_move = scenario.moves.get(benchmark, scenario.moves.get("SPY", -0.10))
-            position_impact = weight * leverage * bench_move
-
-            total_impact += position_impact
-            position_impacts.append(
-                {
-                    "ticker": ticker,
-                    "weight": weight,
-                    "leverage": leverage,
-                    "benchmark": benchmark,
-                    "bench_move": bench_move,
-                    "impact": position_impact,
-                }
+    for i, scenario in enumerate(scenarios):
+        position_impacts: list[dict[str, float | str]] = [
+            {
+                "ticker": ticker,
+                "weight": weight,
+                "leverage": leverage,
+                "benchmark": benchmark,
+                "bench_move": bench_move,
+                "impact": impact,
+            }
+            for ticker, weight, leverage, benchmark, bench_move, impact in zip(
+                tickers,
+                weight_list,
+                leverage_list,
+                benchmarks,
+                bench_moves[i].tolist(),
+                impacts[i].tolist(),
+                strict=True,
             )
-
+        ]
         results.append(
             StressResult(
                 scenario=scenario.name,
-                portfolio_impact=total_impact,
+                portfolio_impact=float(totals[i]),
                 position_impacts=position_impacts,
             )
         )
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
 from ..market.data import get_history
+from . import _technical_kernels as _kernels
 
+_MAX_RSI_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class RSIResult:
     """RSI calculation result."""
 
@@ -20,7 +25,7 @@ class RSIResult:
     is_oversold: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BollingerBands:
     """Bollinger Bands result."""
 
@@ -47,15 +52,12 @@ def calculate_rsi(
     if period <= 0:
         return None
 
-    prices_series = pd.Series(np.array(prices), dtype="float64").dropna()
-    if len(prices_series) < period + 1:
-        return None
-
-    rsi_series = calculate_rsi_series(prices_series, period=period).dropna()
-    if rsi_series.empty:
+    prices_arr = np.asarray(prices, dtype=np.float64)
+    prices_arr = prices_arr[~np.isnan(prices_arr)]
+    if len(prices_arr) < period + 1:
         return None
 
-    return float(rsi_series.iloc[-1])
+    return float(_kernels.rsi(prices_arr, period)[-1])
 
 
 def calculate_rsi_series(
@@ -74,23 +76,9 @@ def calculate_rsi_series(
     if period <= 0:
         return pd.Series(dtype="float64")
 
-    prices = prices.astype("float64")
-    delta = prices.diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-
-    # Wilder-style smoothing via EMA(alpha=1/period).
-    avg_gain = gain.ewm(alpha=1 / period, min_periods=period).mean()
-    avg_loss = loss.ewm(alpha=1 / period, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    rsi = 100 - (100 / (1 + rs))
-
-    # Convention: no losses => RSI 100, no gains and no losses => RSI 50.
-    rsi = rsi.where(avg_loss != 0, 100.0)
-    rsi = rsi.where(~((avg_gain == 0) & (avg_loss == 0)), 50.0)
-
-    return rsi
+    # Wilder-style smoothing via EMA(alpha=1/period), computed in one pass.
+    rsi = _kernels.rsi(prices.to_numpy(dtype=np.float64), period)
+    return pd.Series(rsi, index=prices.index, name=prices.name)
 
 
 def calculate_sma(
@@ -106,7 +94,7 @@ def calculate_sma(
     Returns:
         SMA value or None if insufficient data
     """
-    prices_arr = np.array(prices)
+    prices_arr = np.asarray(prices, dtype=np.float64)
     if len(prices_arr) < period:
         return None
 
@@ -118,7 +106,7 @@ def calculate_ema(
     period: int = 20,
 ) -> float | None:
     """Calculate Exponential Moving Average."""
-    prices_arr = np.array(prices)
+    prices_arr = np.asarray(prices, dtype=np.float64)
     if len(prices_arr) < period:
         return None
     return float(pd.Series(prices_arr).ewm(span=period, adjust=False).mean().iloc[-1])
@@ -139,13 +127,14 @@ def calculate_bollinger_bands(
     Returns:
         BollingerBands object or None if insufficient data
     """
-    prices_arr = np.array(prices)
+    prices_arr = np.asarray(prices, dtype=np.float64)
     if len(prices_arr) < period:
         return None
 
     recent = prices_arr[-period:]
-    middle = float(np.mean(recent))
-    std = float(np.std(recent, ddof=1))
+    middle = float(recent.mean())
+    dev = recent - middle
+    std = math.sqrt(float(dev @ dev) / (period - 1)) if period > 1 else math.nan
 
     upper = middle + (std_dev * std)
     lower = middle - (std_dev * std)
@@ -185,12 +174,13 @@ def detect_rsi_extremes(
     Returns:
         List of RSIResult for tickers with extreme RSI
     """
-    results = []
+    if not tickers:
+        return []
 
-    for ticker in tickers:
+    def _process_one(ticker: str) -> RSIResult | None:
         hist = get_history(ticker, period=period)
         if hist.empty or len(hist) < 15:
-            continue
+            return None
 
         try:
             prices = hist["Close"]
@@ -200,24 +190,26 @@ def detect_rsi_extremes(
 
             rsi = calculate_rsi(prices)
             if rsi is None:
-                continue
+                return None
 
             is_overbought = rsi >= overbought
             is_oversold = rsi <= oversold
 
             if is_overbought or is_oversold:
-                results.append(
-                    RSIResult(
-                        ticker=ticker,
-                        rsi=rsi,
-                        is_overbought=is_overbought,
-                        is_oversold=is_oversold,
-                    )
+                return RSIResult(
+                    ticker=ticker,
+                    rsi=rsi,
+                    is_overbought=is_overbought,
+                    is_oversold=is_oversold,
                 )
         except Exception:
-            continue
+            pass
+        return None
 
-    return results
+    # Cached histories and RSI math overlap; yfinance downloads themselves are
+    # serialised by market.data.download. Results keep input order.
+    with ThreadPoolExecutor(max_workers=min(_MAX_RSI_WORKERS, len(tickers))) as executor:
+        return [r for r in executor.map(_process_one, tickers) if r is not None]
 
 
 def calculate_macd(
@@ -262,16 +254,12 @@ def is_golden_cross(
     Returns:
         True if golden cross detected
     """
-    prices_arr = np.array(prices)
+    prices_arr = np.asarray(prices, dtype=np.float64)
     if len(prices_arr) < slow + 2:
         return False
 
-    fast_ma_prev = np.mean(prices_arr[-(fast + 1) : -1])
-    fast_ma_curr = np.mean(prices_arr[-fast:])
-    slow_ma_prev = np.mean(prices_arr[-(slow + 1) : -1])
-    slow_ma_curr = np.mean(prices_arr[-slow:])
-
-    return bool(fast_ma_prev <= slow_ma_prev and fast_ma_curr > slow_ma_curr)
+    fast_prev, fast_curr, slow_prev, slow_curr = _kernels.cross_means(prices_arr, fast, slow)
+    return bool(fast_prev <= slow_prev and fast_curr > slow_curr)
 
 
 def is_death_cross(
@@ -289,13 +277,32 @@ def is_death_cross(
     Returns:
         True if death cross detected
     """
-    prices_arr = np.array(prices)
+    prices_arr = np.asarray(prices, dtype=np.float64)
     if len(prices_arr) < slow + 2:
         return False
 
-    fast_ma_prev = np.mean(prices_arr[-(fast + 1) : -1])
-    fast_ma_curr = np.mean(prices_arr[-fast:])
-    slow_ma_prev = np.mean(prices_arr[-(slow + 1) : -1])
-    slow_ma_curr = np.mean(prices_arr[-slow:])
+    fast_prev, fast_curr, slow_prev, slow_curr = _kernels.cross_means(prices_arr, fast, slow)
+    return bool(fast_prev >= slow_prev and fast_curr < slow_curr)
+
 
-    return bool(fast_ma_prev >= slow_ma_prev and fast_ma_curr < slow_ma_curr)
+def bulk_cross_signals(
+    prices: np.ndarray,
+    fast: int = 50,
+    slow: int = 200,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Screen many tickers for golden and death crosses at once.
+
+    Args:
+        prices: 2-D array of shape (tickers, days) on a common date axis
+        fast: Fast moving average period
+        slow: Slow moving average period
+
+    Returns:
+        Tuple of boolean arrays (golden, death), one entry per ticker.
+        All False when there are fewer than ``slow + 2`` days.
+    """
+    prices_2d = np.asarray(prices, dtype=np.float64)
+    if prices_2d.ndim != 2 or prices_2d.shape[1] < slow + 2:
+        n_rows = prices_2d.shape[0] if prices_2d.ndim == 2 else 0
+        return np.zeros(n_rows, dtype=bool), np.zeros(n_rows, dtype=bool)
+    return _kernels.cross_signals(np.ascontiguousarray(prices_2d), fast, slow)
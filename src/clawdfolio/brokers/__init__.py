@@ -1,27 +1,36 @@
 """Broker integrations for Portfolio Monitor."""
 
+from importlib import import_module
+
 from .base import BaseBroker
 from .registry import get_broker, list_brokers, register_broker
 
-_DISCOVERED = False
-
-
-def _ensure_registered() -> None:
-    """Lazily import all broker modules so decorators fire."""
-    global _DISCOVERED
-    if _DISCOVERED:
-        return
-    _DISCOVERED = True
-    from . import demo  # noqa: F401
-
-    try:
-        from . import longport  # noqa: F401
-    except ImportError:
-        pass
-    try:
-        from . import futu  # noqa: F401
-    except ImportError:
-        pass
+# Built-in broker modules, imported on first lookup so their decorators fire.
+# Broker SDKs are imported inside connect(), so these load without them.
+_BUILTIN_BROKERS: dict[str, str] = {
+    "demo": ".demo",
+    "longport": ".longport",
+    "futu": ".futu",
+}
+_LOADED: set[str] = set()
+
+
+def _ensure_registered(name: str | None = None) -> None:
+    """Lazily import built-in broker modules so decorators fire.
+
+    A module that fails to import is skipped and retried on the next lookup.
+
+    Args:
+        name: Import only this broker's module; all of them when None.
+    """
+    for key in _BUILTIN_BROKERS if name is None else (name,):
+        if key in _LOADED or key not in _BUILTIN_BROKERS:
+            continue
+        try:
+            import_module(_BUILTIN_BROKERS[key], __name__)
+        except ImportError:
+            continue
+        _LOADED.add(key)
 
 
 __all__ = [
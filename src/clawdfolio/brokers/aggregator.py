@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -18,8 +19,8 @@ def aggregate_portfolios(brokers: list[BaseBroker]) -> Portfolio:
     """Fetch and merge portfolios from multiple brokers.
 
     Positions with the same ticker are combined (quantity, market_value,
-    day_pnl summed; avg_cost weighted-averaged). Brokers that fail to
-    connect are skipped with a warning.
+    day_pnl summed; avg_cost weighted-averaged). Brokers are queried
+    concurrently; those that fail to connect are skipped with a warning.
 
     Args:
         brokers: List of broker instances to aggregate.
@@ -39,21 +40,26 @@ def aggregate_portfolios(brokers: list[BaseBroker]) -> Portfolio:
     sources: list[str] = []
     succeeded = 0
 
-    for broker in brokers:
-        try:
-            if not broker.is_connected():
-                broker.connect()
-            port = broker.get_portfolio()
-            all_positions.extend(port.positions)
-            total_cash += port.cash
-            total_net += port.net_assets
-            total_mv += port.market_value
-            total_buying += port.buying_power
-            total_day_pnl += port.day_pnl
-            sources.append(port.source)
-            succeeded += 1
-        except Exception as exc:
-            print(f"Warning: {broker.name} failed: {exc}", file=sys.stderr)
+    # Connect/fetch round-trips are independent per broker, so overlap them
+    if brokers:
+        with ThreadPoolExecutor(max_workers=len(brokers)) as executor:
+            portfolios = list(executor.map(_fetch_one, brokers))
+    else:
+        portfolios = []
+
+    # Warn from this thread: a worker may be inside a broker's suppress_stdio
+    for broker, port in zip(brokers, portfolios, strict=True):
+        if isinstance(port, Exception):
+            print(f"Warning: {broker.name} failed: {port}", file=sys.stderr)
+            continue
+        all_positions.extend(port.positions)
+        total_cash += port.cash
+        total_net += port.net_assets
+        total_mv += port.market_value
+        total_buying += port.buying_power
+        total_day_pnl += port.day_pnl
+        sources.append(port.source)
+        succeeded += 1
 
     if succeeded == 0:
         raise BrokerError("all", "No broker returned data")
@@ -77,12 +83,26 @@ def aggregate_portfolios(brokers: list[BaseBroker]) -> Portfolio:
     )
 
 
+def _fetch_one(broker: BaseBroker) -> Portfolio | Exception:
+    """Connect if needed and fetch one broker's portfolio; the error on failure."""
+    try:
+        if not broker.is_connected():
+            broker.connect()
+        return broker.get_portfolio()
+    except Exception as exc:
+        return exc
+
+
 def _merge_positions(positions: list[Position]) -> list[Position]:
     """Merge positions with the same ticker.
 
     For duplicate tickers: sum quantity/market_value/day_pnl,
     weighted-average avg_cost, take latest current_price.
     """
+    # Common case: a single broker or disjoint holdings, nothing to merge
+    if len({pos.symbol.ticker for pos in positions}) == len(positions):
+        return list(positions)
+
     by_ticker: dict[str, list[Position]] = {}
     for pos in positions:
         by_ticker.setdefault(pos.symbol.ticker, []).append(pos)
@@ -95,18 +115,24 @@ def _merge_positions(positions: list[Position]) -> list[Position]:
 
         # Combine
         base = group[0]
-        total_qty = sum((p.quantity for p in group), Decimal("0"))
-        total_mv = sum((p.market_value for p in group), Decimal("0"))
-        total_day_pnl = sum((p.day_pnl for p in group), Decimal("0"))
-        total_unrealized = sum((p.unrealized_pnl for p in group), Decimal("0"))
+        total_qty = Decimal("0")
+        total_mv = Decimal("0")
+        total_day_pnl = Decimal("0")
+        total_unrealized = Decimal("0")
 
-        # Weighted average cost
+        # Totals and weighted average cost in a single pass over the group
         cost_sum = Decimal("0")
         qty_sum = Decimal("0")
         for p in group:
-            if p.avg_cost and p.quantity > 0:
-                cost_sum += p.avg_cost * p.quantity
-                qty_sum += p.quantity
+            qty = p.quantity
+            total_qty += qty
+            total_mv += p.market_value
+            total_day_pnl += p.day_pnl
+            total_unrealized += p.unrealized_pnl
+            cost = p.avg_cost
+            if cost and qty > 0:
+                cost_sum += cost * qty
+                qty_sum += qty
         avg_cost = (cost_sum / qty_sum) if qty_sum > 0 else base.avg_cost
 
         # Use whichever has a current_price
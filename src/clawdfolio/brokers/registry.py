@@ -53,9 +53,10 @@ def get_broker(name: str, config: BrokerConfig | None = None) -> BaseBroker:
     """
     from . import _ensure_registered
 
-    _ensure_registered()
+    _ensure_registered(name)
 
     if name not in _BROKER_REGISTRY:
+        _ensure_registered()
         available = ", ".join(_BROKER_REGISTRY.keys()) or "none"
         raise KeyError(f"Unknown broker '{name}'. Available brokers: {available}")
 
@@ -3,22 +3,30 @@
 from __future__ import annotations
 
 import argparse
-import logging
 import sys
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, TextIO
 
 from .. import __version__
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from collections.abc import Callable
 
-logger = logging.getLogger(__name__)
+    import pandas as pd
+
+    from ..core.config import Config
 
+    _SubParsers = argparse._SubParsersAction[argparse.ArgumentParser]
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    from ..finance.workflows import category_choices
 
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser.
+
+    Args:
+        command: Subcommand about to be parsed. When given, only that
+            subparser is built; otherwise every subcommand is registered.
+    """
     # Parent parser for shared flags (allows flags before or after subcommand).
     # Uses SUPPRESS defaults so subparser values only override when explicitly provided.
     parent_parser = argparse.ArgumentParser(add_help=False)
@@ -76,7 +84,19 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Summary command
+    # Only the requested subcommand is registered when known; otherwise all of them
+    # (for --help, bare invocations and argparse's own "invalid choice" errors).
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers, parent_parser)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers, parent_parser)
+
+    return parser
+
+
+def _add_summary_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``summary`` subcommand."""
     summary_parser = subparsers.add_parser(
         "summary", help="Show portfolio summary", parents=[parent_parser]
     )
@@ -88,7 +108,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Number of top holdings to show (default: 10)",
     )
 
-    # Quotes command
+
+def _add_quotes_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``quotes`` subcommand."""
     quotes_parser = subparsers.add_parser(
         "quotes", help="Get real-time quotes", parents=[parent_parser]
     )
@@ -98,7 +120,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Symbols to get quotes for",
     )
 
-    # Risk command
+
+def _add_risk_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``risk`` subcommand."""
     risk_parser = subparsers.add_parser(
         "risk", help="Show risk metrics", parents=[parent_parser]
     )
@@ -109,7 +133,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Show detailed risk analysis",
     )
 
-    # Alerts command
+
+def _add_alerts_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``alerts`` subcommand."""
     alerts_parser = subparsers.add_parser(
         "alerts", help="Show current alerts", parents=[parent_parser]
     )
@@ -145,7 +171,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Email recipient (overrides config)",
     )
 
-    # Earnings command
+
+def _add_earnings_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``earnings`` subcommand."""
     earnings_parser = subparsers.add_parser(
         "earnings", help="Show upcoming earnings", parents=[parent_parser]
     )
@@ -156,9 +184,17 @@ def create_parser() -> argparse.ArgumentParser:
         help="Days to look ahead (default: 14)",
     )
 
-    # Export command
+
+def _add_export_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``export`` subcommand."""
     export_parser = subparsers.add_parser(
-        "export", help="Export portfolio data to CSV or JSON files", parents=[parent_parser]
+        "export",
+        help="Export portfolio data to CSV or JSON files",
+        description=(
+            "Export portfolio data for --broker; the default 'all' aggregates every "
+            "enabled broker in the config and falls back to demo when none is set up."
+        ),
+        parents=[parent_parser],
     )
     export_parser.add_argument(
         "what",
@@ -177,7 +213,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Output file path (default: stdout)",
     )
 
-    # DCA command
+
+def _add_dca_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``dca`` subcommand."""
     dca_parser = subparsers.add_parser(
         "dca", help="DCA signals and analysis", parents=[parent_parser]
     )
@@ -199,7 +237,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Monthly DCA amount (default: 1000)",
     )
 
-    # Options command
+
+def _add_options_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``options`` subcommand."""
     options_parser = subparsers.add_parser(
         "options",
         help="Option quote, chain, expiry list, and buyback monitor",
@@ -273,7 +313,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Exit with code 1 if no target is triggered",
     )
 
-    # Bubble command
+
+def _add_bubble_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``bubble`` subcommand."""
     bubble_parser = subparsers.add_parser(
         "bubble", help="Market Bubble Index", parents=[parent_parser]
     )
@@ -283,22 +325,30 @@ def create_parser() -> argparse.ArgumentParser:
         help="Export result as JSON",
     )
 
-    # Factors command
+
+def _add_factors_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``factors`` subcommand."""
     subparsers.add_parser(
         "factors", help="Fama-French factor exposure analysis", parents=[parent_parser]
     )
 
-    # Stress command
+
+def _add_stress_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``stress`` subcommand."""
     subparsers.add_parser(
         "stress", help="Leverage-adjusted stress testing", parents=[parent_parser]
     )
 
-    # Greeks command
+
+def _add_greeks_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``greeks`` subcommand."""
     subparsers.add_parser(
         "greeks", help="Aggregate portfolio-level Greeks", parents=[parent_parser]
     )
 
-    # Snapshot command
+
+def _add_snapshot_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``snapshot`` subcommand."""
     snapshot_parser = subparsers.add_parser(
         "snapshot", help="Save portfolio snapshot to history", parents=[parent_parser]
     )
@@ -307,7 +357,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to history CSV (default: ~/.clawdfolio/history.csv)",
     )
 
-    # Performance command
+
+def _add_performance_parser(
+    subparsers: _SubParsers, parent_parser: argparse.ArgumentParser
+) -> None:
+    """Register the ``performance`` subcommand."""
     performance_parser = subparsers.add_parser(
         "performance", help="Show portfolio performance over time", parents=[parent_parser]
     )
@@ -322,7 +376,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to history CSV (default: ~/.clawdfolio/history.csv)",
     )
 
-    # Compare command
+
+def _add_compare_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``compare`` subcommand."""
     compare_parser = subparsers.add_parser(
         "compare", help="Compare portfolio vs benchmark", parents=[parent_parser]
     )
@@ -341,7 +397,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to history CSV (default: ~/.clawdfolio/history.csv)",
     )
 
-    # Finance command
+
+def _add_finance_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``finance`` subcommand."""
+    from ..finance.workflows import CATEGORY_LABELS
+
     finance_parser = subparsers.add_parser(
         "finance",
         help="Run migrated local finance workflows (v2)",
@@ -358,7 +418,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     finance_list_parser.add_argument(
         "--category",
-        choices=category_choices(),
+        choices=sorted(CATEGORY_LABELS),
         help="Filter by workflow category",
     )
 
@@ -394,7 +454,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Force sync scripts before run",
     )
 
-    # History command
+
+def _add_history_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``history`` subcommand."""
     history_parser = subparsers.add_parser(
         "history", help="Portfolio history management", parents=[parent_parser]
     )
@@ -405,7 +467,9 @@ def create_parser() -> argparse.ArgumentParser:
     history_perf = history_subparsers.add_parser("performance", help="Performance metrics")
     history_perf.add_argument("--days", type=int, default=30)
 
-    # Rebalance command
+
+def _add_rebalance_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``rebalance`` subcommand."""
     rebalance_parser = subparsers.add_parser(
         "rebalance", help="Portfolio rebalancing", parents=[parent_parser]
     )
@@ -414,13 +478,51 @@ def create_parser() -> argparse.ArgumentParser:
     rebalance_propose = rebalance_subparsers.add_parser("propose", help="Propose allocation")
     rebalance_propose.add_argument("--amount", type=float, required=True)
 
-    # Dashboard command
+
+def _add_dashboard_parser(subparsers: _SubParsers, parent_parser: argparse.ArgumentParser) -> None:
+    """Register the ``dashboard`` subcommand."""
     dashboard_parser = subparsers.add_parser(
         "dashboard", help="Launch Streamlit dashboard", parents=[parent_parser]
     )
     dashboard_parser.add_argument("--port", type=int, default=8501)
 
-    return parser
+
+_SUBPARSER_BUILDERS: dict[str, Callable[[_SubParsers, argparse.ArgumentParser], None]] = {
+    "summary": _add_summary_parser,
+    "quotes": _add_quotes_parser,
+    "risk": _add_risk_parser,
+    "alerts": _add_alerts_parser,
+    "earnings": _add_earnings_parser,
+    "export": _add_export_parser,
+    "dca": _add_dca_parser,
+    "options": _add_options_parser,
+    "bubble": _add_bubble_parser,
+    "factors": _add_factors_parser,
+    "stress": _add_stress_parser,
+    "greeks": _add_greeks_parser,
+    "snapshot": _add_snapshot_parser,
+    "performance": _add_performance_parser,
+    "compare": _add_compare_parser,
+    "finance": _add_finance_parser,
+    "history": _add_history_parser,
+    "rebalance": _add_rebalance_parser,
+    "dashboard": _add_dashboard_parser,
+}
+
+
+def _get_config(args: Namespace) -> Config:
+    """Return the config for this invocation, parsing the file at most once.
+
+    main() stores the config it loads on ``args``; handlers called directly
+    (e.g. from tests) load and memoize it here on first use.
+    """
+    config: Config | None = getattr(args, "_config", None)
+    if config is None:
+        from ..core.config import load_config
+
+        config = load_config(getattr(args, "config", None))
+        args._config = config
+    return config
 
 
 def _get_portfolio(args: Namespace):  # type: ignore[no-untyped-def]
@@ -429,17 +531,23 @@ def _get_portfolio(args: Namespace):  # type: ignore[no-untyped-def]
 
     if args.broker == "all":
         from ..brokers.aggregator import aggregate_portfolios
-        from ..core.config import load_config
 
-        config = load_config(getattr(args, "config", None))
+        config = _get_config(args)
         brokers = []
+        unknown = []
         for name, bcfg in config.brokers.items():
             if not bcfg.enabled or name == "demo":
                 continue
             try:
                 brokers.append(get_broker(name, bcfg))
             except KeyError:
-                pass
+                print(f"Warning: unknown broker '{name}' in config", file=sys.stderr)
+                unknown.append(name)
+
+        if not brokers and unknown:
+            from ..core.exceptions import BrokerError
+
+            raise BrokerError("all", f"No known broker configured: {', '.join(unknown)}")
 
         if not brokers:
             # Fall back to demo if no real brokers configured
@@ -478,11 +586,12 @@ def cmd_summary(args: Namespace) -> int:
 def cmd_quotes(args: Namespace) -> int:
     """Handle quotes command."""
     from ..market.data import get_quotes_yfinance
-    from ..output.json import to_json
 
     quotes = get_quotes_yfinance(args.symbols)
 
     if args.output == "json":
+        from ..output.json import dump_json
+
         data = {
             ticker: {
                 "price": float(q.price),
@@ -491,14 +600,14 @@ def cmd_quotes(args: Namespace) -> int:
             }
             for ticker, q in quotes.items()
         }
-        print(to_json(data))
+        dump_json(data)
     else:
-        print("\nQuotes:")
-        print("-" * 50)
+        lines = ["\nQuotes:", "-" * 50]
         for ticker, q in quotes.items():
             change = q.change_pct or 0
             sign = "+" if change > 0 else ""
-            print(f"{ticker:8} ${float(q.price):>10,.2f}  {sign}{change * 100:.2f}%")
+            lines.append(f"{ticker:8} ${float(q.price):>10,.2f}  {sign}{change * 100:.2f}%")
+        print("\n".join(lines))
 
     return 0
 
@@ -531,13 +640,21 @@ def cmd_risk(args: Namespace) -> int:
 
 def _print_detailed_risk(portfolio: Any, metrics: Any) -> None:
     """Print additional detailed risk info: correlation, sectors, RSI, concentration."""
+    from concurrent.futures import ThreadPoolExecutor
+
     from ..analysis.concentration import analyze_concentration
     from ..analysis.technical import detect_rsi_extremes
 
     tickers = [p.symbol.ticker for p in portfolio.positions]
 
+    # Sector lookups and RSI histories are independent network fetches;
+    # overlap them instead of waiting on one and then the other
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        conc_future = executor.submit(analyze_concentration, portfolio)
+        rsi_results = detect_rsi_extremes(tickers, overbought=70, oversold=30)
+        conc = conc_future.result()
+
     # RSI extremes
-    rsi_results = detect_rsi_extremes(tickers, overbought=70, oversold=30)
     if rsi_results:
         print("\nRSI Extremes:")
         print("-" * 40)
@@ -550,7 +667,6 @@ def _print_detailed_risk(portfolio: Any, metrics: Any) -> None:
         print(f"\nGARCH(1,1) Vol Forecast: {metrics.garch_vol_forecast * 100:.1f}%")
 
     # Concentration
-    conc = analyze_concentration(portfolio)
     if conc:
         cm = conc.get("metrics")
         if cm:
@@ -578,13 +694,13 @@ def _print_detailed_risk(portfolio: Any, metrics: Any) -> None:
 
 def cmd_alerts(args: Namespace) -> int:
     """Handle alerts command."""
-    from ..core.config import load_config
+    from ..core.types import AlertSeverity
     from ..monitors.earnings import EarningsMonitor
     from ..monitors.price import PriceMonitor
 
     try:
         portfolio = _get_portfolio(args)
-        config = load_config(getattr(args, "config", None))
+        config = _get_config(args)
 
         # Collect alerts
         all_alerts = []
@@ -595,7 +711,9 @@ def cmd_alerts(args: Namespace) -> int:
 
         # Filter by severity if specified
         if args.severity:
-            all_alerts = [a for a in all_alerts if a.severity.value == args.severity]
+            # Enum members are singletons, so identity is an exact match
+            target = AlertSeverity(args.severity)
+            all_alerts = [a for a in all_alerts if a.severity is target]
 
         if args.output == "json":
             from ..output.json import JSONFormatter
@@ -632,10 +750,9 @@ def _send_alert_notifications(args: Any, config: Any, alerts: Any, method: str)
 
     # Build message text
     lines = [f"Clawdfolio Alerts ({len(alerts)} triggered)\n"]
-    for a in alerts:
-        lines.append(f"[{a.severity.value.upper()}] {a.title}")
-        lines.append(a.message)
-        lines.append("")
+    lines.extend(
+        line for a in alerts for line in (f"[{a.severity.value.upper()}] {a.title}", a.message, "")
+    )
     message = "\n".join(lines)
 
     # Build config from CLI args + config file fallback
@@ -673,7 +790,7 @@ def cmd_earnings(args: Namespace) -> int:
         events = get_upcoming_earnings(portfolio, days_ahead=args.days)
 
         if args.output == "json":
-            from ..output.json import to_json
+            from ..output.json import dump_json
 
             data = [
                 {
@@ -685,7 +802,7 @@ def cmd_earnings(args: Namespace) -> int:
                 }
                 for e in events
             ]
-            print(to_json(data))
+            dump_json(data)
         else:
             print(format_earnings_calendar(events))
 
@@ -697,58 +814,54 @@ def cmd_earnings(args: Namespace) -> int:
 
 def cmd_export(args: Namespace) -> int:
     """Handle export command."""
-    from ..brokers import get_broker
     from ..output.export import (
-        export_alerts_csv,
         export_alerts_json,
-        export_portfolio_csv,
         export_portfolio_json,
-        export_risk_csv,
         export_risk_json,
+        write_alerts_csv,
+        write_portfolio_csv,
+        write_risk_csv,
     )
 
-    broker_name = args.broker if args.broker != "all" else "demo"
-
     try:
-        broker = get_broker(broker_name)
-        broker.connect()
-        portfolio = broker.get_portfolio()
+        portfolio = _get_portfolio(args)
 
+        subject: Any
+        write_csv: Callable[[Any, TextIO], None]
+        json_text: Callable[[Any], str]
         if args.what == "portfolio":
-            content = (
-                export_portfolio_csv(portfolio)
-                if args.format == "csv"
-                else export_portfolio_json(portfolio)
-            )
+            subject = portfolio
+            write_csv, json_text = write_portfolio_csv, export_portfolio_json
         elif args.what == "risk":
             from ..analysis.risk import analyze_risk
 
-            metrics = analyze_risk(portfolio)
-            content = (
-                export_risk_csv(metrics) if args.format == "csv" else export_risk_json(metrics)
-            )
+            subject = analyze_risk(portfolio)
+            write_csv, json_text = write_risk_csv, export_risk_json
         elif args.what == "alerts":
             from ..monitors.earnings import EarningsMonitor
             from ..monitors.price import PriceMonitor
 
-            all_alerts = []
-            all_alerts.extend(PriceMonitor().check_portfolio(portfolio))
-            all_alerts.extend(EarningsMonitor().check_portfolio(portfolio))
-            content = (
-                export_alerts_csv(all_alerts)
-                if args.format == "csv"
-                else export_alerts_json(all_alerts)
-            )
+            subject = []
+            subject.extend(PriceMonitor().check_portfolio(portfolio))
+            subject.extend(EarningsMonitor().check_portfolio(portfolio))
+            write_csv, json_text = write_alerts_csv, export_alerts_json
         else:
             print(f"Unknown export target: {args.what}", file=sys.stderr)
             return 1
 
+        def _emit(fp: TextIO) -> None:
+            # CSV rows stream straight to the destination; no full-text copy
+            if args.format == "csv":
+                write_csv(subject, fp)
+            else:
+                fp.write(json_text(subject))
+
         if args.file:
-            with open(args.file, "w") as f:
-                f.write(content)
+            with open(args.file, "w", encoding="utf-8", newline="") as f:
+                _emit(f)
             print(f"Exported to {args.file}")
         else:
-            print(content, end="")
+            _emit(sys.stdout)
 
         return 0
     except Exception as e:
@@ -758,7 +871,6 @@ def cmd_export(args: Namespace) -> int:
 
 def cmd_dca(args: Namespace) -> int:
     """Handle DCA command."""
-    from ..output.json import to_json
     from ..strategies.dca import calculate_dca_performance
 
     if not args.symbol:
@@ -777,7 +889,9 @@ def cmd_dca(args: Namespace) -> int:
             return 1
 
         if args.output == "json":
-            print(to_json(result))
+            from ..output.json import dump_json
+
+            dump_json(result)
         else:
             print(f"\nDCA Analysis: {args.symbol}")
             print("-" * 40)
@@ -819,7 +933,6 @@ def cmd_performance(args: Namespace) -> int:
         format_performance_table,
         read_snapshots,
     )
-    from ..output.json import to_json
 
     try:
         rows = read_snapshots(path=getattr(args, "file", None))
@@ -827,7 +940,9 @@ def cmd_performance(args: Namespace) -> int:
         perf = compute_performance(rows)
 
         if args.output == "json":
-            print(to_json(perf))
+            from ..output.json import dump_json
+
+            dump_json(perf)
         else:
             print(format_performance_table(perf))
 
@@ -839,9 +954,10 @@ def cmd_performance(args: Namespace) -> int:
 
 def cmd_compare(args: Namespace) -> int:
     """Handle compare command — portfolio vs benchmark."""
+    from operator import attrgetter
+
     from ..core.history import filter_by_period, read_snapshots
     from ..market.data import get_history
-    from ..output.json import to_json
 
     try:
         rows = read_snapshots(path=getattr(args, "file", None))
@@ -851,9 +967,10 @@ def cmd_compare(args: Namespace) -> int:
             print("No snapshot data available. Run 'clawdfolio snapshot' first.")
             return 1
 
-        sorted_rows = sorted(rows, key=lambda r: r.date)
-        port_start = sorted_rows[0].net_assets
-        port_end = sorted_rows[-1].net_assets
+        # Only the endpoints matter; on equal dates keep the first row for the
+        # start and the last one for the end, as a stable sort would
+        port_start = min(rows, key=attrgetter("date")).net_assets
+        port_end = max(reversed(rows), key=attrgetter("date")).net_assets
         port_return = ((port_end - port_start) / port_start * 100) if port_start else 0.0
 
         # Fetch benchmark
@@ -865,13 +982,14 @@ def cmd_compare(args: Namespace) -> int:
             print(f"Could not fetch benchmark data for {args.benchmark}")
             return 1
 
-        close = bench_df["Close"].dropna()
-        if close.empty:
+        close = bench_df["Close"]
+        first_idx = close.first_valid_index()
+        if first_idx is None:
             print(f"No price data for {args.benchmark}")
             return 1
 
-        bench_start = float(close.iloc[0])
-        bench_end = float(close.iloc[-1])
+        bench_start = float(close.loc[first_idx])
+        bench_end = float(close.loc[close.last_valid_index()])
         bench_return = ((bench_end - bench_start) / bench_start * 100) if bench_start else 0.0
 
         alpha = port_return - bench_return
@@ -885,7 +1003,9 @@ def cmd_compare(args: Namespace) -> int:
         }
 
         if args.output == "json":
-            print(to_json(result))
+            from ..output.json import dump_json
+
+            dump_json(result)
         else:
             print(f"\nPortfolio vs {args.benchmark} ({args.period})")
             print("=" * 45)
@@ -899,23 +1019,89 @@ def cmd_compare(args: Namespace) -> int:
         return 1
 
 
-def cmd_options(args: Namespace) -> int:
-    """Handle options command."""
+_CHAIN_COLUMNS: tuple[str, ...] = (
+    "contractSymbol",
+    "strike",
+    "bid",
+    "ask",
+    "lastPrice",
+    "impliedVolatility",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "openInterest",
+    "volume",
+)
+
+
+def _chain_table(df: pd.DataFrame | None, limit: int) -> pd.DataFrame:
+    """Select the displayed chain columns, sorted by strike, first ``limit`` rows."""
     import pandas as pd
 
-    from ..core.config import load_config
-    from ..market.data import get_option_chain, get_option_expiries, get_option_quote
-    from ..monitors.options import OptionBuybackMonitor, format_buyback_report
-    from ..output.json import to_json
+    if df is None or df.empty:
+        return pd.DataFrame(columns=list(_CHAIN_COLUMNS))
+    # reindex builds the new frame in one step; absent columns become None
+    out = df.reindex(columns=list(_CHAIN_COLUMNS))
+    missing = [col for col in _CHAIN_COLUMNS if col not in df.columns]
+    if missing:
+        out[missing] = None
+    out = out.sort_values("strike")
+    return out.head(limit).reset_index(drop=True)
+
+
+def _chain_records(table: pd.DataFrame) -> list[dict[str, Any]]:
+    """Chain rows as dicts, with missing values as ``None`` so the output stays valid JSON."""
+    # Column-wise tolist() skips to_dict's per-cell boxing; NaN is patched
+    # only in the columns that have any
+    columns = list(table.columns)
+    data = []
+    for name in columns:
+        col = table[name]
+        values = col.tolist()
+        if col.hasnans:
+            values = [None if na else v for v, na in zip(values, col.isna().tolist(), strict=True)]
+        data.append(values)
+    return [dict(zip(columns, row, strict=True)) for row in zip(*data, strict=True)]
+
+
+# Fixed-width console row: symbol left-aligned, numeric columns right-aligned
+_CHAIN_ROW_FMT = "{:<22}" + "".join(f" {{:>{max(len(col), 8)}}}" for col in _CHAIN_COLUMNS[1:])
+
+
+def _chain_cell(value: Any) -> str:
+    """Render one chain cell; missing values show as ``-``."""
+    if value is None or value != value:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4f}".rstrip("0").rstrip(".")
+    return str(value)
+
+
+def _format_chain_table(table: pd.DataFrame) -> str:
+    """Format a ``_chain_table`` result as fixed-width console text."""
+    if table.empty:
+        return "(empty)"
+    lines = [_CHAIN_ROW_FMT.format(*_CHAIN_COLUMNS)]
+    for row in table.itertuples(index=False, name=None):
+        lines.append(_CHAIN_ROW_FMT.format(*map(_chain_cell, row)))
+    return "\n".join(lines)
+
+
+def cmd_options(args: Namespace) -> int:
+    """Handle options command."""
+    from ..output.json import dump_json
 
     if args.options_command is None:
         print("Usage: clawdfolio options [quote|chain|expiries|buyback] ...")
         return 1
 
     if args.options_command == "expiries":
+        from ..market.data import get_option_expiries
+
         expiries = get_option_expiries(args.symbol)
         if args.output == "json":
-            print(to_json({"symbol": args.symbol, "expiries": expiries}))
+            dump_json({"symbol": args.symbol, "expiries": expiries})
         else:
             if not expiries:
                 print(f"No option expiries found for {args.symbol}.")
@@ -926,6 +1112,8 @@ def cmd_options(args: Namespace) -> int:
         return 0
 
     if args.options_command == "quote":
+        from ..market.data import get_option_quote
+
         quote = get_option_quote(
             args.symbol,
             args.expiry,
@@ -940,7 +1128,7 @@ def cmd_options(args: Namespace) -> int:
             )
             return 1
         if args.output == "json":
-            print(to_json(quote))
+            dump_json(quote)
         else:
             print(
                 f"Option quote: {args.symbol} {args.expiry} {quote.option_type}{int(quote.strike)}"
@@ -956,6 +1144,8 @@ def cmd_options(args: Namespace) -> int:
         return 0
 
     if args.options_command == "chain":
+        from ..market.data import get_option_chain
+
         chain = get_option_chain(args.symbol, args.expiry)
         if chain is None:
             print(
@@ -964,60 +1154,32 @@ def cmd_options(args: Namespace) -> int:
             )
             return 1
 
-        def _pick_columns(df: pd.DataFrame) -> pd.DataFrame:
-            wanted = [
-                "contractSymbol",
-                "strike",
-                "bid",
-                "ask",
-                "lastPrice",
-                "impliedVolatility",
-                "delta",
-                "gamma",
-                "theta",
-                "vega",
-                "openInterest",
-                "volume",
-            ]
-            if df is None or df.empty:
-                return pd.DataFrame(columns=wanted)
-            out = df.copy()
-            for col in wanted:
-                if col not in out.columns:
-                    out[col] = None
-            out = out[wanted]
-            if "strike" in out.columns:
-                out = out.sort_values("strike")
-            return out.head(max(int(args.limit), 1)).reset_index(drop=True)
-
-        calls = _pick_columns(chain.calls)
-        puts = _pick_columns(chain.puts)
+        limit = max(int(args.limit), 1)
+        want_calls = args.side in ("both", "calls")
+        want_puts = args.side in ("both", "puts")
 
         if args.output == "json":
             payload = {
                 "symbol": args.symbol,
                 "expiry": args.expiry,
-                "calls": calls.to_dict(orient="records"),
-                "puts": puts.to_dict(orient="records"),
+                "calls": _chain_records(_chain_table(chain.calls, limit)) if want_calls else [],
+                "puts": _chain_records(_chain_table(chain.puts, limit)) if want_puts else [],
             }
-            if args.side == "calls":
-                payload["puts"] = []
-            elif args.side == "puts":
-                payload["calls"] = []
-            print(to_json(payload))
+            dump_json(payload)
         else:
             print(f"Option chain: {args.symbol} {args.expiry}")
-            with pd.option_context("display.max_columns", 20, "display.width", 140):
-                if args.side in ("both", "calls"):
-                    print("\nCalls:")
-                    print(calls.to_string(index=False) if not calls.empty else "(empty)")
-                if args.side in ("both", "puts"):
-                    print("\nPuts:")
-                    print(puts.to_string(index=False) if not puts.empty else "(empty)")
+            if want_calls:
+                print("\nCalls:")
+                print(_format_chain_table(_chain_table(chain.calls, limit)))
+            if want_puts:
+                print("\nPuts:")
+                print(_format_chain_table(_chain_table(chain.puts, limit)))
         return 0
 
     if args.options_command == "buyback":
-        config = load_config(args.config)
+        from ..monitors.options import OptionBuybackMonitor, format_buyback_report
+
+        config = _get_config(args)
         monitor = OptionBuybackMonitor(config.option_buyback)
         result = monitor.check()
         if result is None:
@@ -1029,7 +1191,7 @@ def cmd_options(args: Namespace) -> int:
             return 1
 
         if args.output == "json":
-            print(to_json(result))
+            dump_json(result)
         else:
             print(format_buyback_report(result))
 
@@ -1044,12 +1206,13 @@ def cmd_options(args: Namespace) -> int:
 def cmd_bubble(args: Namespace) -> int:
     """Handle bubble command — Market Bubble Index."""
     from ..analysis.bubble import calculate_bubble_index
-    from ..output.json import to_json
 
     try:
         result = calculate_bubble_index()
 
         if getattr(args, "export_json", False) or args.output == "json":
+            from ..output.json import dump_json
+
             data = {
                 "composite_score": result.composite_score,
                 "sentiment_score": result.sentiment_score,
@@ -1067,7 +1230,7 @@ def cmd_bubble(args: Namespace) -> int:
                     for k, v in result.indicators.items()
                 },
             }
-            print(to_json(data))
+            dump_json(data)
         else:
             print("\nMarket Bubble Index")
             print("=" * 50)
@@ -1125,20 +1288,18 @@ def cmd_factors(args: Namespace) -> int:
         exposure = analyze_factor_exposure(port_returns, period="1y")
 
         if args.output == "json":
-            from ..output.json import to_json
+            from ..output.json import dump_json
 
-            print(
-                to_json(
-                    {
-                        "factor_loadings": exposure.factor_loadings,
-                        "t_stats": exposure.t_stats,
-                        "p_values": exposure.p_values,
-                        "r_squared": exposure.r_squared,
-                        "alpha_annualized": exposure.alpha_annualized,
-                        "alpha_t_stat": exposure.alpha_t_stat,
-                        "alpha_p_value": exposure.alpha_p_value,
-                    }
-                )
+            dump_json(
+                {
+                    "factor_loadings": exposure.factor_loadings,
+                    "t_stats": exposure.t_stats,
+                    "p_values": exposure.p_values,
+                    "r_squared": exposure.r_squared,
+                    "alpha_annualized": exposure.alpha_annualized,
+                    "alpha_t_stat": exposure.alpha_t_stat,
+                    "alpha_p_value": exposure.alpha_p_value,
+                }
             )
         else:
             print("\nFama-French 3-Factor Exposure")
@@ -1178,7 +1339,7 @@ def cmd_stress(args: Namespace) -> int:
         results = stress_test_portfolio(portfolio)
 
         if args.output == "json":
-            from ..output.json import to_json
+            from ..output.json import dump_json
 
             data = [
                 {
@@ -1188,7 +1349,7 @@ def cmd_stress(args: Namespace) -> int:
                 }
                 for r in results
             ]
-            print(to_json(data))
+            dump_json(data)
         else:
             net_assets = float(portfolio.net_assets)
             print("\nStress Test Results")
@@ -1257,13 +1418,20 @@ def cmd_finance(args: Namespace) -> int:
     """Handle finance workflow orchestration command."""
     from ..finance.runner import default_workspace_path, initialize_workspace, run_workflow
     from ..finance.workflows import CATEGORY_LABELS, grouped_workflows
-    from ..output.json import to_json
+    from ..output.json import dump_json
 
     if args.finance_command is None:
         args.finance_command = "list"
 
     if args.finance_command == "list":
-        groups = grouped_workflows(category=getattr(args, "category", None))
+        category = getattr(args, "category", None)
+        if category and category not in CATEGORY_LABELS:
+            print(
+                f"Error: unknown category {category!r} (choose from {', '.join(CATEGORY_LABELS)})",
+                file=sys.stderr,
+            )
+            return 1
+        groups = grouped_workflows(category=category)
         if args.output == "json":
             list_payload = {
                 "groups": [
@@ -1284,15 +1452,17 @@ def cmd_finance(args: Namespace) -> int:
                 ],
                 "workspace_default": str(default_workspace_path()),
             }
-            print(to_json(list_payload))
+            dump_json(list_payload)
             return 0
 
-        print("Finance workflows (v2):")
+        # Collect the listing and write it once rather than per line
+        lines = ["Finance workflows (v2):"]
         for cat, label, items in groups:
-            print(f"\n[{label}] ({cat})")
-            for wf in items:
-                print(f"- {wf.workflow_id:30} {wf.name} [{wf.script}]")
-                print(f"  {wf.description}")
+            lines.append(f"\n[{label}] ({cat})")
+            lines.extend(
+                f"- {wf.workflow_id:30} {wf.name} [{wf.script}]\n  {wf.description}" for wf in items
+            )
+        print("\n".join(lines))
         return 0
 
     if args.finance_command == "init":
@@ -1309,14 +1479,16 @@ def cmd_finance(args: Namespace) -> int:
                 "data_created": result.data_created,
                 "categories": CATEGORY_LABELS,
             }
-            print(to_json(init_payload))
+            dump_json(init_payload)
             return 0
 
-        print(f"Finance workspace: {result.workspace}")
-        print(f"Scripts synced: {result.scripts_synced}")
-        print(f"Archive scripts synced: {result.archive_synced}")
-        print(f"Config created: {'yes' if result.config_created else 'no'}")
-        print(f"Data dir created: {'yes' if result.data_created else 'no'}")
+        print(
+            f"Finance workspace: {result.workspace}\n"
+            f"Scripts synced: {result.scripts_synced}\n"
+            f"Archive scripts synced: {result.archive_synced}\n"
+            f"Config created: {'yes' if result.config_created else 'no'}\n"
+            f"Data dir created: {'yes' if result.data_created else 'no'}"
+        )
         return 0
 
     if args.finance_command == "run":
@@ -1343,7 +1515,7 @@ def cmd_finance(args: Namespace) -> int:
 
 def cmd_history(args: Namespace) -> int:
     """Handle history command."""
-    from ..output.json import to_json
+    from ..output.json import dump_json
     from ..storage.repository import get_performance, get_snapshots, save_snapshot
 
     if not getattr(args, "history_command", None):
@@ -1355,15 +1527,13 @@ def cmd_history(args: Namespace) -> int:
             portfolio = _get_portfolio(args)
             snap = save_snapshot(portfolio)
             if args.output == "json":
-                print(
-                    to_json(
-                        {
-                            "timestamp": snap.timestamp.isoformat(),
-                            "net_assets": snap.net_assets,
-                            "cash": snap.cash,
-                            "market_value": snap.market_value,
-                        }
-                    )
+                dump_json(
+                    {
+                        "timestamp": snap.timestamp.isoformat(),
+                        "net_assets": snap.net_assets,
+                        "cash": snap.cash,
+                        "market_value": snap.market_value,
+                    }
                 )
             else:
                 print(f"Snapshot saved: NAV=${snap.net_assets:,.2f} at {snap.timestamp}")
@@ -1376,19 +1546,17 @@ def cmd_history(args: Namespace) -> int:
         days = getattr(args, "days", 30)
         snapshots = get_snapshots(days=days)
         if args.output == "json":
-            print(
-                to_json(
-                    [
-                        {
-                            "timestamp": s.timestamp.isoformat(),
-                            "net_assets": s.net_assets,
-                            "cash": s.cash,
-                            "market_value": s.market_value,
-                            "day_pnl": s.day_pnl,
-                        }
-                        for s in snapshots
-                    ]
-                )
+            dump_json(
+                [
+                    {
+                        "timestamp": s.timestamp.isoformat(),
+                        "net_assets": s.net_assets,
+                        "cash": s.cash,
+                        "market_value": s.market_value,
+                        "day_pnl": s.day_pnl,
+                    }
+                    for s in snapshots
+                ]
             )
         else:
             from ..output.console import RICH_AVAILABLE, ConsoleFormatter
@@ -1412,21 +1580,19 @@ def cmd_history(args: Namespace) -> int:
             print("No snapshot data available. Run 'clawdfolio history snapshot' first.")
             return 1
         if args.output == "json":
-            print(
-                to_json(
-                    {
-                        "total_snapshots": metrics.total_snapshots,
-                        "starting_nav": metrics.starting_nav,
-                        "ending_nav": metrics.ending_nav,
-                        "total_return_pct": metrics.total_return_pct,
-                        "max_drawdown_pct": metrics.max_drawdown_pct,
-                        "avg_daily_pnl": metrics.avg_daily_pnl,
-                        "best_day_pnl": metrics.best_day_pnl,
-                        "worst_day_pnl": metrics.worst_day_pnl,
-                        "positive_days": metrics.positive_days,
-                        "negative_days": metrics.negative_days,
-                    }
-                )
+            dump_json(
+                {
+                    "total_snapshots": metrics.total_snapshots,
+                    "starting_nav": metrics.starting_nav,
+                    "ending_nav": metrics.ending_nav,
+                    "total_return_pct": metrics.total_return_pct,
+                    "max_drawdown_pct": metrics.max_drawdown_pct,
+                    "avg_daily_pnl": metrics.avg_daily_pnl,
+                    "best_day_pnl": metrics.best_day_pnl,
+                    "worst_day_pnl": metrics.worst_day_pnl,
+                    "positive_days": metrics.positive_days,
+                    "negative_days": metrics.negative_days,
+                }
             )
         else:
             from ..output.console import RICH_AVAILABLE, ConsoleFormatter
@@ -1444,8 +1610,7 @@ def cmd_history(args: Namespace) -> int:
 
 def cmd_rebalance(args: Namespace) -> int:
     """Handle rebalance command."""
-    from ..core.config import load_config
-    from ..output.json import to_json
+    from ..output.json import dump_json
     from ..strategies.rebalance import (
         TargetAllocation,
         calculate_rebalance,
@@ -1456,7 +1621,7 @@ def cmd_rebalance(args: Namespace) -> int:
         print("Usage: clawdfolio rebalance [check|propose]")
         return 1
 
-    config = load_config(getattr(args, "config", None))
+    config = _get_config(args)
     if not config.rebalancing.targets:
         print("No rebalancing targets configured. Add targets to config file.")
         return 1
@@ -1474,21 +1639,19 @@ def cmd_rebalance(args: Namespace) -> int:
                 portfolio, targets, tolerance=config.rebalancing.tolerance
             )
             if args.output == "json":
-                print(
-                    to_json(
-                        [
-                            {
-                                "ticker": a.ticker,
-                                "current_weight": a.current_weight,
-                                "target_weight": a.target_weight,
-                                "deviation": a.deviation,
-                                "status": a.status,
-                                "dollar_amount": a.dollar_amount,
-                                "shares": a.shares,
-                            }
-                            for a in actions
-                        ]
-                    )
+                dump_json(
+                    [
+                        {
+                            "ticker": a.ticker,
+                            "current_weight": a.current_weight,
+                            "target_weight": a.target_weight,
+                            "deviation": a.deviation,
+                            "status": a.status,
+                            "dollar_amount": a.dollar_amount,
+                            "shares": a.shares,
+                        }
+                        for a in actions
+                    ]
                 )
             else:
                 from ..output.console import RICH_AVAILABLE, ConsoleFormatter
@@ -1507,21 +1670,19 @@ def cmd_rebalance(args: Namespace) -> int:
             amount = args.amount
             actions = propose_dca_allocation(portfolio, targets, amount)
             if args.output == "json":
-                print(
-                    to_json(
-                        [
-                            {
-                                "ticker": a.ticker,
-                                "current_weight": a.current_weight,
-                                "target_weight": a.target_weight,
-                                "deviation": a.deviation,
-                                "status": a.status,
-                                "dollar_amount": a.dollar_amount,
-                                "shares": a.shares,
-                            }
-                            for a in actions
-                        ]
-                    )
+                dump_json(
+                    [
+                        {
+                            "ticker": a.ticker,
+                            "current_weight": a.current_weight,
+                            "target_weight": a.target_weight,
+                            "deviation": a.deviation,
+                            "status": a.status,
+                            "dollar_amount": a.dollar_amount,
+                            "shares": a.shares,
+                        }
+                        for a in actions
+                    ]
                 )
             else:
                 from ..output.console import RICH_AVAILABLE, ConsoleFormatter
@@ -1567,57 +1728,104 @@ def cmd_dashboard(args: Namespace) -> int:
     return 0
 
 
+# Subcommand -> handler function name, resolved at dispatch time so only
+# the selected handler is looked up (and tests can patch it by name)
+_COMMANDS: dict[str, str] = {
+    "summary": "cmd_summary",
+    "quotes": "cmd_quotes",
+    "risk": "cmd_risk",
+    "alerts": "cmd_alerts",
+    "earnings": "cmd_earnings",
+    "export": "cmd_export",
+    "dca": "cmd_dca",
+    "snapshot": "cmd_snapshot",
+    "performance": "cmd_performance",
+    "compare": "cmd_compare",
+    "options": "cmd_options",
+    "bubble": "cmd_bubble",
+    "factors": "cmd_factors",
+    "stress": "cmd_stress",
+    "greeks": "cmd_greeks",
+    "finance": "cmd_finance",
+    "history": "cmd_history",
+    "rebalance": "cmd_rebalance",
+    "dashboard": "cmd_dashboard",
+}
+
+
+# Root-level options that consume the following token as their value
+_ROOT_VALUE_OPTIONS = frozenset({"--broker", "--output", "-o", "--config", "-c"})
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in ``argv`` without building a parser.
+
+    Returns None when help is requested before any subcommand, so the full
+    parser (listing every command) is built.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("-h", "--help"):
+            return None
+        if token in _ROOT_VALUE_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token
+    return None
+
+
+@cache
+def _parser_for(command: str | None) -> argparse.ArgumentParser:
+    """Return ``create_parser(command)``, built once per process.
+
+    Parsing never mutates the parser, so repeated in-process ``main()`` calls
+    can share it.
+    """
+    return create_parser(command)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
-    from ..core.config import load_config
-    from ..market.data import set_default_ttl
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser: argparse.ArgumentParser | None = None
+    if not argv:
+        # Bare `clawdfolio` is the common interactive call; argparse would only
+        # fill in its defaults, so skip building the parser altogether
+        args = argparse.Namespace(
+            broker="all", output="console", config=None, command="summary", top=10
+        )
+    else:
+        command = _peek_command(argv)
+        # Unknown tokens share the full parser so the cache stays bounded
+        parser = _parser_for(command if command in _SUBPARSER_BUILDERS else None)
+        args, extras = parser.parse_known_args(argv)
+
+        if extras:
+            if args.command == "finance" and args.finance_command == "run":
+                args.script_args = extras
+            else:
+                parser.error(f"unrecognized arguments: {' '.join(extras)}")
 
-    parser = create_parser()
-    args, extras = parser.parse_known_args(argv)
+        if args.command is None:
+            # Default to summary
+            args.command = "summary"
+            args.top = 10
 
-    # Apply cache_ttl from config
-    config = load_config(getattr(args, "config", None))
+    # Apply cache_ttl from config; handlers reuse this parse via _get_config
+    config = _get_config(args)
     if config.cache_ttl:
+        from ..market.data import set_default_ttl
+
         set_default_ttl(config.cache_ttl)
 
-    if extras:
-        if args.command == "finance" and args.finance_command == "run":
-            args.script_args = extras
-        else:
-            parser.error(f"unrecognized arguments: {' '.join(extras)}")
-
-    if args.command is None:
-        # Default to summary
-        args.command = "summary"
-        args.top = 10
-
-    commands = {
-        "summary": cmd_summary,
-        "quotes": cmd_quotes,
-        "risk": cmd_risk,
-        "alerts": cmd_alerts,
-        "earnings": cmd_earnings,
-        "export": cmd_export,
-        "dca": cmd_dca,
-        "snapshot": cmd_snapshot,
-        "performance": cmd_performance,
-        "compare": cmd_compare,
-        "options": cmd_options,
-        "bubble": cmd_bubble,
-        "factors": cmd_factors,
-        "stress": cmd_stress,
-        "greeks": cmd_greeks,
-        "finance": cmd_finance,
-        "history": cmd_history,
-        "rebalance": cmd_rebalance,
-        "dashboard": cmd_dashboard,
-    }
-
-    handler = commands.get(args.command)
-    if handler:
+    handler_name = _COMMANDS.get(args.command)
+    if handler_name:
+        handler: Callable[[Namespace], int] = globals()[handler_name]
         return handler(args)
 
-    parser.print_help()
+    (parser or _parser_for(None)).print_help()
     return 1
 
 
@@ -52,7 +52,7 @@ class AlertSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a tradable symbol."""
 
@@ -119,7 +119,7 @@ class Quote:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a portfolio position."""
 
@@ -162,7 +162,7 @@ class Position:
             self.unrealized_pnl_pct = float((quote.price - self.avg_cost) / self.avg_cost)
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """Aggregated portfolio data."""
 
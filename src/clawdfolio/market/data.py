@@ -10,12 +10,13 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any
 
 from ..core.types import Quote, Symbol
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Lazy yfinance import
@@ -31,6 +32,18 @@ def _import_yf() -> Any:
     return _yf
 
 
+# yf.download collects results in module-global state (``shared._DFS``,
+# reset on every call in 0.2.x), so concurrent downloads can drop or swap
+# each other's frames. Callers on worker threads go through download().
+_download_lock = threading.Lock()
+
+
+def download(yf: Any, tickers: str | list[str], **kwargs: Any) -> Any:
+    """Call ``yf.download`` with other downloads in this process held off."""
+    with _download_lock:
+        return yf.download(tickers, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Thread-safe in-memory cache
 # ---------------------------------------------------------------------------
@@ -126,12 +139,14 @@ def get_price(ticker: str) -> float | None:
 
 def get_history(ticker: str, period: str = "1y") -> pd.DataFrame:
     """Get price history. Cached 1 hour."""
+    import pandas as pd
+
     yf = _import_yf()
     sym = _yf_symbol(ticker)
 
     def _fetch() -> pd.DataFrame:
         try:
-            df = yf.download(sym, period=period, interval="1d", progress=False, auto_adjust=True)
+            df = download(yf, sym, period=period, interval="1d", progress=False, auto_adjust=True)
             # Handle MultiIndex columns from yfinance (e.g., ('Close', 'AAPL'))
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = df.columns.get_level_values(0)
@@ -146,6 +161,8 @@ def get_history(ticker: str, period: str = "1y") -> pd.DataFrame:
 
 def get_history_multi(tickers: list[str], period: str = "1y") -> pd.DataFrame:
     """Get price history for multiple tickers. Cached 1 hour."""
+    import pandas as pd
+
     yf = _import_yf()
     syms = [_yf_symbol(t) for t in tickers]
     sym_to_ticker = dict(zip(syms, tickers, strict=False))
@@ -153,7 +170,7 @@ def get_history_multi(tickers: list[str], period: str = "1y") -> pd.DataFrame:
 
     def _fetch() -> pd.DataFrame:
         try:
-            df = yf.download(syms, period=period, interval="1d", progress=False, auto_adjust=True)
+            df = download(yf, syms, period=period, interval="1d", progress=False, auto_adjust=True)
             if df is None or df.empty:
                 return pd.DataFrame()
 
@@ -218,6 +235,8 @@ def _get_quote_uncached(sym: str, ticker: str, yf: Any) -> Quote | None:
         # Fallback when fast_info/info misses price fields.
         if price is None or prev_close is None:
             try:
+                import pandas as pd
+
                 hist = t.history(period="5d", interval="1d", auto_adjust=False)
                 if isinstance(getattr(hist, "columns", None), pd.MultiIndex):
                     hist.columns = hist.columns.get_level_values(0)
@@ -262,6 +281,8 @@ def get_quotes_yfinance(tickers: list[str]) -> dict[str, Quote]:
     Uses ``yfinance.download`` for batch fetching when possible, falling
     back to individual ``get_quote`` calls for any tickers that fail.
     """
+    import pandas as pd
+
     if not tickers:
         return {}
 
@@ -271,7 +292,7 @@ def get_quotes_yfinance(tickers: list[str]) -> dict[str, Quote]:
     sym_to_ticker = dict(zip(syms, tickers, strict=False))
 
     try:
-        df = yf.download(syms, period="5d", interval="1d", progress=False, auto_adjust=False)
+        df = download(yf, syms, period="5d", interval="1d", progress=False, auto_adjust=False)
         if df is not None and not df.empty:
             if isinstance(df.columns, pd.MultiIndex):
                 close_df = df["Close"] if "Close" in df.columns.get_level_values(0) else None
@@ -574,6 +595,8 @@ def _get_option_chain_moomoo(ticker: str, expiry: str) -> OptionChainData | None
     if not _moomoo_available():
         return None
 
+    import pandas as pd
+
     try:
         from futu.common import ft_logger
 
@@ -638,6 +661,8 @@ def _get_option_chain_moomoo(ticker: str, expiry: str) -> OptionChainData | None
 
 def get_option_chain(ticker: str, expiry: str) -> OptionChainData | None:
     """Get option chain for a ticker and expiry date. moomoo first, yfinance fallback."""
+    import pandas as pd
+
     key = f"opt_chain:{ticker}:{expiry}"
 
     def _fetch() -> OptionChainData | None:
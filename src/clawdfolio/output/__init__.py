@@ -8,8 +8,11 @@ from .export import (
     export_portfolio_json,
     export_risk_csv,
     export_risk_json,
+    write_alerts_csv,
+    write_portfolio_csv,
+    write_risk_csv,
 )
-from .json import JSONFormatter, to_json
+from .json import JSONFormatter, dump_json, to_json
 
 __all__ = [
     "ConsoleFormatter",
@@ -17,10 +20,14 @@ __all__ = [
     "print_risk_metrics",
     "JSONFormatter",
     "to_json",
+    "dump_json",
     "export_portfolio_csv",
     "export_portfolio_json",
     "export_risk_csv",
     "export_risk_json",
     "export_alerts_csv",
     "export_alerts_json",
+    "write_portfolio_csv",
+    "write_risk_csv",
+    "write_alerts_csv",
 ]
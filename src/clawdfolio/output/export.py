@@ -4,16 +4,15 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 if TYPE_CHECKING:
     from ..core.types import Alert, Portfolio, RiskMetrics
 
 
-def export_portfolio_csv(portfolio: Portfolio) -> str:
-    """Export portfolio positions to CSV string."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def write_portfolio_csv(portfolio: Portfolio, fp: TextIO) -> None:
+    """Write portfolio positions as CSV rows to an open text file."""
+    writer = csv.writer(fp)
     writer.writerow(
         [
             "ticker",
@@ -47,13 +46,18 @@ def export_portfolio_csv(portfolio: Portfolio) -> str:
                 f"{pos.unrealized_pnl_pct:.4f}",
             ]
         )
-    return output.getvalue()
 
 
-def export_risk_csv(metrics: RiskMetrics) -> str:
-    """Export risk metrics to CSV string."""
+def export_portfolio_csv(portfolio: Portfolio) -> str:
+    """Export portfolio positions to CSV string."""
     output = io.StringIO()
-    writer = csv.writer(output)
+    write_portfolio_csv(portfolio, output)
+    return output.getvalue()
+
+
+def write_risk_csv(metrics: RiskMetrics, fp: TextIO) -> None:
+    """Write risk metrics as CSV rows to an open text file."""
+    writer = csv.writer(fp)
     writer.writerow(["metric", "value"])
     rows = [
         ("volatility_20d", metrics.volatility_20d),
@@ -75,13 +79,18 @@ def export_risk_csv(metrics: RiskMetrics) -> str:
     ]
     for name, value in rows:
         writer.writerow([name, f"{value:.6f}" if value is not None else ""])
-    return output.getvalue()
 
 
-def export_alerts_csv(alerts: list[Alert]) -> str:
-    """Export alerts to CSV string."""
+def export_risk_csv(metrics: RiskMetrics) -> str:
+    """Export risk metrics to CSV string."""
     output = io.StringIO()
-    writer = csv.writer(output)
+    write_risk_csv(metrics, output)
+    return output.getvalue()
+
+
+def write_alerts_csv(alerts: list[Alert], fp: TextIO) -> None:
+    """Write alerts as CSV rows to an open text file."""
+    writer = csv.writer(fp)
     writer.writerow(
         [
             "type",
@@ -107,6 +116,12 @@ def export_alerts_csv(alerts: list[Alert]) -> str:
                 alert.timestamp.isoformat(),
             ]
         )
+
+
+def export_alerts_csv(alerts: list[Alert]) -> str:
+    """Export alerts to CSV string."""
+    output = io.StringIO()
+    write_alerts_csv(alerts, output)
     return output.getvalue()
 
 
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
     from ..core.types import Alert, Portfolio, RiskMetrics
@@ -134,3 +135,14 @@ def to_json(obj: Any, indent: int = 2) -> str:
     Handles dataclasses, Decimal, datetime, and Enum automatically.
     """
     return json.dumps(obj, cls=CustomJSONEncoder, indent=indent, ensure_ascii=False)
+
+
+def dump_json(obj: Any, fp: TextIO | None = None, indent: int = 2) -> None:
+    """Serialize any object as JSON straight to ``fp`` (stdout by default).
+
+    Produces the same text as :func:`to_json` followed by a newline, without
+    building the whole document in memory first.
+    """
+    out = sys.stdout if fp is None else fp
+    json.dump(obj, out, cls=CustomJSONEncoder, indent=indent, ensure_ascii=False)
+    out.write("\n")
@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import os
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 
+# Redirection is process-wide, so overlapping uses (brokers fetched on
+# worker threads) share one redirect: the first entry saves the real fds
+# and the last exit restores them.
+_lock = threading.Lock()
+_depth = 0
+_saved: tuple[int, int, int] | None = None
+
 
 @contextmanager
 def suppress_stdio() -> Generator[None, None, None]:
@@ -15,18 +23,26 @@ def suppress_stdio() -> Generator[None, None, None]:
     file-descriptor level.  This context manager redirects fd 1 and fd 2
     to ``/dev/null`` and restores them on exit.
     """
-    devnull = os.open(os.devnull, os.O_WRONLY)
-    saved_out = os.dup(1)
-    saved_err = os.dup(2)
+    global _depth, _saved
+    with _lock:
+        if _depth == 0:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            _saved = (devnull, os.dup(1), os.dup(2))
+            os.dup2(devnull, 1)
+            os.dup2(devnull, 2)
+        _depth += 1
     try:
-        os.dup2(devnull, 1)
-        os.dup2(devnull, 2)
         yield
     finally:
-        try:
-            os.dup2(saved_out, 1)
-            os.dup2(saved_err, 2)
-        finally:
-            os.close(saved_out)
-            os.close(saved_err)
-            os.close(devnull)
+        with _lock:
+            _depth -= 1
+            if _depth == 0 and _saved is not None:
+                devnull, saved_out, saved_err = _saved
+                _saved = None
+                try:
+                    os.dup2(saved_out, 1)
+                    os.dup2(saved_err, 2)
+                finally:
+                    os.close(saved_out)
+                    os.close(saved_err)
+                    os.close(devnull)
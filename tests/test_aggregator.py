@@ -52,6 +52,8 @@ class TestMergePositions:
         positions = [_pos("AAPL"), _pos("MSFT")]
         merged = _merge_positions(positions)
         assert len(merged) == 2
+        assert merged == positions
+        assert merged is not positions
 
     def test_merge_same_ticker(self):
         p1 = _pos("AAPL", qty=100, price=Decimal("150"), avg_cost=Decimal("140"), source="a")
@@ -106,8 +108,8 @@ class TestAggregatePortfolios:
 
         result = aggregate_portfolios([b1, b2])
         assert result.cash == Decimal("5000")
-        assert "longport" in result.source
-        assert "futu" in result.source
+        # Concurrent fetches still merge in broker order
+        assert result.source == "longport+futu"
         tickers = [p.symbol.ticker for p in result.positions]
         assert "AAPL" in tickers
         assert "MSFT" in tickers
@@ -129,6 +131,30 @@ class TestAggregatePortfolios:
         assert result.source == "good"
         assert len(result.positions) == 1
 
+    def test_failure_warning_survives_suppressed_broker(self, capfd):
+        import time
+        from unittest.mock import MagicMock
+
+        from clawdfolio.utils import suppress_stdio
+
+        def quiet_fetch():
+            with suppress_stdio():
+                time.sleep(0.05)
+            return _make_portfolio([_pos("AAPL")], source="quiet")
+
+        quiet = MagicMock()
+        quiet.name = "quiet"
+        quiet.is_connected.return_value = True
+        quiet.get_portfolio.side_effect = quiet_fetch
+
+        bad = MagicMock()
+        bad.name = "bad"
+        bad.is_connected.return_value = False
+        bad.connect.side_effect = Exception("connection failed")
+
+        aggregate_portfolios([quiet, bad])
+        assert "Warning: bad failed: connection failed" in capfd.readouterr().err
+
     def test_all_brokers_fail(self):
         from unittest.mock import MagicMock
 
@@ -1,5 +1,7 @@
 """Tests for analysis modules."""
 
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 
@@ -15,11 +17,15 @@ from clawdfolio.analysis.risk import (
     calculate_volatility,
 )
 from clawdfolio.analysis.technical import (
+    bulk_cross_signals,
     calculate_bollinger_bands,
     calculate_ema,
     calculate_rsi,
     calculate_rsi_series,
     calculate_sma,
+    detect_rsi_extremes,
+    is_death_cross,
+    is_golden_cross,
 )
 
 
@@ -222,6 +228,57 @@ class TestTechnicalIndicators:
         assert bands.bandwidth > 0
         assert 0 <= bands.percent_b <= 1 or bands.percent_b < 0 or bands.percent_b > 1
 
+    def test_bulk_cross_signals_match_single_ticker_checks(self):
+        """Batched cross screening agrees with the per-ticker helpers."""
+        flat_row = np.full(211, 100.0)
+        golden_row = np.concatenate([flat_row[:-1], [101.0]])
+        death_row = np.concatenate([flat_row[:-1], [99.0]])
+        prices = np.vstack([golden_row, death_row, flat_row])
+
+        golden, death = bulk_cross_signals(prices)
+
+        assert golden.tolist() == [is_golden_cross(row) for row in prices]
+        assert death.tolist() == [is_death_cross(row) for row in prices]
+        assert golden.tolist() == [True, False, False]
+        assert death.tolist() == [False, True, False]
+
+    def test_cross_means_match_direct_window_means(self):
+        """The sliding running sums agree with directly averaged windows."""
+        from clawdfolio.analysis._technical_kernels import cross_means
+
+        np.random.seed(7)
+        prices = 100 + np.cumsum(np.random.normal(0, 1, 260))
+        for fast, slow in ((50, 200), (5, 20), (30, 10)):
+            expected = (
+                prices[-(fast + 1) : -1].mean(),
+                prices[-fast:].mean(),
+                prices[-(slow + 1) : -1].mean(),
+                prices[-slow:].mean(),
+            )
+            assert np.allclose(cross_means(prices, fast, slow), expected)
+
+    def test_bulk_cross_signals_insufficient_data(self):
+        golden, death = bulk_cross_signals(np.ones((3, 50)))
+        assert not golden.any() and not death.any()
+        assert golden.shape == (3,)
+
+    def test_detect_rsi_extremes_keeps_ticker_order(self):
+        """Concurrent history fetches still return results in input order."""
+        rising = pd.DataFrame({"Close": np.arange(100.0, 130.0)})
+        falling = pd.DataFrame({"Close": np.arange(130.0, 100.0, -1.0)})
+        flat = pd.DataFrame({"Close": [100.0, 101.0] * 15})
+        histories = {"UP": rising, "FLAT": flat, "DOWN": falling, "NONE": pd.DataFrame()}
+
+        with patch(
+            "clawdfolio.analysis.technical.get_history",
+            side_effect=lambda ticker, period: histories[ticker],
+        ):
+            results = detect_rsi_extremes(["UP", "FLAT", "DOWN", "NONE"])
+
+        assert [r.ticker for r in results] == ["UP", "DOWN"]
+        assert results[0].is_overbought
+        assert results[1].is_oversold
+
     def test_calculate_beta_insufficient_data(self):
         """Test beta with insufficient data returns None."""
         asset = np.random.normal(0, 0.01, 10)
@@ -1,5 +1,8 @@
 """Tests for broker integrations."""
 
+import subprocess
+import sys
+
 import pytest
 
 from clawdfolio.brokers.base import BaseBroker
@@ -58,6 +61,37 @@ class TestBrokerRegistry:
         with pytest.raises(KeyError):
             get_broker("nonexistent")
 
+    def test_get_broker_imports_only_requested_module(self):
+        """Looking up one built-in broker does not import the others."""
+        code = (
+            "import sys; from clawdfolio.brokers import get_broker; get_broker('demo'); "
+            "print(any(m in sys.modules for m in "
+            "('clawdfolio.brokers.futu', 'clawdfolio.brokers.longport')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_unknown_broker_lists_all_builtins(self):
+        """The error for an unknown name lists every built-in broker."""
+        with pytest.raises(KeyError, match="futu"):
+            get_broker("nonexistent")
+
+    def test_builtins_register_without_sdks(self):
+        """SDKs load in connect(), so every built-in registers without them."""
+        assert {"demo", "longport", "futu"} <= set(list_brokers())
+
+    def test_failed_builtin_import_is_retried(self, monkeypatch):
+        """A module that fails to import is not marked as loaded."""
+        import clawdfolio.brokers as brokers
+
+        monkeypatch.setitem(brokers._BUILTIN_BROKERS, "ghost", ".ghost_broker")
+        monkeypatch.setattr(brokers, "_LOADED", set())
+        brokers._ensure_registered("ghost")
+        assert "ghost" not in brokers._LOADED
+        assert "ghost" not in list_brokers()
+
     def test_register_duplicate_broker(self):
         """Test registering duplicate broker raises error."""
 
@@ -24,11 +24,120 @@ def _make_download_df(n: int = 300, start: float = 100.0, seed: int = 42) -> pd.
     return pd.DataFrame({"Close": prices})
 
 
+def _make_pair_download_df(n: int = 300) -> pd.DataFrame:
+    """Make a batched HYG/IEF download with (field, ticker) columns."""
+    hyg = _make_price_series(n=n, start=80.0, seed=1)
+    ief = _make_price_series(n=n, start=95.0, seed=2)
+    return pd.concat({("Close", "HYG"): hyg, ("Close", "IEF"): ief}, axis=1)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from clawdfolio.analysis.bubble import _fred_client
+
+    monkeypatch.setattr("clawdfolio.analysis.bubble.CACHE_DIR", tmp_path)
+    monkeypatch.setattr("clawdfolio.analysis.bubble._memory_cache", {})
+    _fred_client.cache_clear()
+
+
+class TestDiskCache:
+    def test_second_call_served_from_disk(self) -> None:
+        from clawdfolio.analysis.bubble import _disk_cached
+
+        fetch = MagicMock(return_value=_make_price_series(n=10))
+        first = _disk_cached("yf_QQQ_5y", fetch)
+        second = _disk_cached("yf_QQQ_5y", fetch)
+        assert fetch.call_count == 1
+        pd.testing.assert_series_equal(first, second, check_freq=False)
+
+    def test_repeat_call_skips_disk(self, tmp_path) -> None:
+        from clawdfolio.analysis.bubble import _disk_cached
+
+        fetch = MagicMock(return_value=_make_download_df(n=10))
+        first = _disk_cached("yf_IEF_2y", fetch)
+        (tmp_path / "yf_IEF_2y.pkl").unlink()
+        assert _disk_cached("yf_IEF_2y", fetch) is first
+        assert fetch.call_count == 1
+
+    def test_empty_result_not_cached(self) -> None:
+        from clawdfolio.analysis.bubble import _disk_cached
+
+        fetch = MagicMock(return_value=pd.DataFrame())
+        _disk_cached("yf_^VIX_5y", fetch)
+        _disk_cached("yf_^VIX_5y", fetch)
+        assert fetch.call_count == 2
+
+
+class TestFredClient:
+    def test_client_shared_per_api_key(self) -> None:
+        from clawdfolio.analysis.bubble import _fred_client
+
+        mock_fredapi = MagicMock()
+        with patch.dict("sys.modules", {"fredapi": mock_fredapi}):
+            assert _fred_client("key") is _fred_client("key")
+        mock_fredapi.Fred.assert_called_once_with(api_key="key")
+
+
+class TestFredSeriesCache:
+    def test_stale_cache_fetches_only_new_observations(self, tmp_path) -> None:
+        import os
+
+        from clawdfolio.analysis.bubble import _fred_series
+
+        index = pd.bdate_range(
+            end=pd.Timestamp.today().normalize() - pd.Timedelta(days=10), periods=5
+        )
+        pd.Series([1.0, 2.0, 3.0, 4.0, 5.0], index=index).to_pickle(tmp_path / "fred_PCCE.pkl")
+        yesterday = pd.Timestamp.today().timestamp() - 86400
+        os.utime(tmp_path / "fred_PCCE.pkl", (yesterday, yesterday))
+
+        tail_index = pd.bdate_range(start=index[-1] + pd.Timedelta(days=1), periods=3)
+        fred = MagicMock()
+        fred.get_series.return_value = pd.Series([6.0, 7.0, 8.0], index=tail_index)
+
+        data = _fred_series(fred, "PCCE")
+        fred.get_series.assert_called_once_with(
+            "PCCE", observation_start=index[-1] + pd.Timedelta(days=1)
+        )
+        assert data.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+        assert _fred_series(fred, "PCCE").tolist() == data.tolist()
+        assert fred.get_series.call_count == 1
+
+    def test_up_to_date_cache_fills_memory_cache(self, tmp_path) -> None:
+        import os
+
+        from clawdfolio.analysis.bubble import _fred_series
+
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=3)
+        pd.Series([1.0, 2.0, 3.0], index=index).to_pickle(tmp_path / "fred_VIXCLS.pkl")
+        yesterday = pd.Timestamp.today().timestamp() - 86400
+        os.utime(tmp_path / "fred_VIXCLS.pkl", (yesterday, yesterday))
+
+        fred = MagicMock()
+        first = _fred_series(fred, "VIXCLS")
+        (tmp_path / "fred_VIXCLS.pkl").unlink()
+        assert _fred_series(fred, "VIXCLS") is first
+        fred.get_series.assert_not_called()
+
+    def test_refresh_failure_returns_cached(self, tmp_path) -> None:
+        import os
+
+        from clawdfolio.analysis.bubble import _fred_series
+
+        index = pd.bdate_range(end="2024-01-31", periods=3)
+        pd.Series([1.0, 2.0, 3.0], index=index).to_pickle(tmp_path / "fred_T10Y2Y.pkl")
+        os.utime(tmp_path / "fred_T10Y2Y.pkl", (0, 0))
+
+        fred = MagicMock()
+        fred.get_series.side_effect = RuntimeError("offline")
+        assert _fred_series(fred, "T10Y2Y").tolist() == [1.0, 2.0, 3.0]
+
+
 class TestPercentileRank:
     def test_basic_ranking(self) -> None:
         from clawdfolio.analysis.bubble import _percentile_rank
 
-        history = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0])
+        history = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
         assert _percentile_rank(3.0, history) == pytest.approx(40.0)
         assert _percentile_rank(6.0, history) == pytest.approx(100.0)
         assert _percentile_rank(0.0, history) == pytest.approx(0.0)
@@ -36,7 +145,38 @@ class TestPercentileRank:
     def test_empty_history(self) -> None:
         from clawdfolio.analysis.bubble import _percentile_rank
 
-        assert _percentile_rank(5.0, pd.Series(dtype=float)) == 50.0
+        assert _percentile_rank(5.0, np.array([])) == 50.0
+
+    def test_sorted_history_drops_nan(self) -> None:
+        from clawdfolio.analysis.bubble import _percentile_rank, _sorted_history
+
+        history = _sorted_history(pd.Series([5.0, np.nan, 1.0, 3.0, 2.0, 4.0]))
+        assert history.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert _percentile_rank(3.0, history) == pytest.approx(40.0)
+
+
+class TestSmaKernel:
+    def test_matches_pandas_rolling_mean(self) -> None:
+        from clawdfolio.analysis._bubble_kernels import sma
+
+        prices = _make_price_series(n=400)
+        expected = prices.rolling(200).mean().dropna().to_numpy()
+        np.testing.assert_allclose(sma(prices.to_numpy(), 200), expected)
+
+    def test_short_input_is_empty(self) -> None:
+        from clawdfolio.analysis._bubble_kernels import sma
+
+        assert sma(np.ones(50), 200).size == 0
+
+
+class TestRollingCorrKernel:
+    def test_matches_pandas_rolling_corr(self) -> None:
+        from clawdfolio.analysis._bubble_kernels import rolling_corr
+
+        x = _make_price_series(n=300, seed=1).pct_change().dropna()
+        y = _make_price_series(n=300, seed=2).pct_change().dropna()
+        expected = x.rolling(60).corr(y).dropna().to_numpy()
+        np.testing.assert_allclose(rolling_corr(x.to_numpy(), y.to_numpy(), 60), expected)
 
 
 class TestClassifyRegime:
@@ -62,6 +202,14 @@ class TestClassifyRegime:
         assert _classify_regime(60.0) == "ELEVATED"
         assert _classify_regime(59.9) == "NORMAL"
 
+    def test_nan_score_is_not_an_alarm(self) -> None:
+        from clawdfolio.analysis.bubble import _classify_regime, _risk_regime
+
+        assert _classify_regime(float("nan")) == "NORMAL"
+        assert _risk_regime(float("nan")) == "low_risk"
+        assert _risk_regime(66.0) == "high_risk"
+        assert _risk_regime(39.9) == "low_risk"
+
 
 class TestCalcQQQDeviation:
     @patch("clawdfolio.analysis.bubble._safe_download")
@@ -115,6 +263,18 @@ class TestCalcSectorBreadth:
         assert result.name == "Sector Breadth"
         assert 0.0 <= result.normalized_score <= 100.0
 
+    @patch("clawdfolio.analysis.bubble._safe_download")
+    def test_batched_multi_ticker_download(self, mock_dl: MagicMock) -> None:
+        from clawdfolio.analysis.bubble import calc_sector_breadth
+
+        up = _make_price_series(n=400, start=50.0)
+        down = pd.Series(np.linspace(100.0, 50.0, 400), index=up.index)
+        mock_dl.return_value = pd.concat({("Close", "XLK"): up, ("Close", "XLE"): down}, axis=1)
+        result = calc_sector_breadth()
+        assert mock_dl.call_count == 1
+        assert result is not None
+        assert result.raw_value == pytest.approx(0.5)
+
     @patch("clawdfolio.analysis.bubble._safe_download")
     def test_no_data(self, mock_dl: MagicMock) -> None:
         from clawdfolio.analysis.bubble import calc_sector_breadth
@@ -129,8 +289,9 @@ class TestCalcCreditSpread:
     def test_returns_result(self, mock_dl: MagicMock) -> None:
         from clawdfolio.analysis.bubble import calc_credit_spread
 
-        mock_dl.return_value = _make_download_df(n=300)
+        mock_dl.return_value = _make_pair_download_df(n=300)
         result = calc_credit_spread()
+        assert mock_dl.call_count == 1
         assert result is not None
         assert result.name == "Credit Spread (HYG/IEF)"
         assert 0.0 <= result.normalized_score <= 100.0
@@ -139,7 +300,15 @@ class TestCalcCreditSpread:
     def test_insufficient_data(self, mock_dl: MagicMock) -> None:
         from clawdfolio.analysis.bubble import calc_credit_spread
 
-        mock_dl.return_value = _make_download_df(n=30)
+        mock_dl.return_value = _make_pair_download_df(n=30)
+        result = calc_credit_spread()
+        assert result is None
+
+    @patch("clawdfolio.analysis.bubble._safe_download")
+    def test_missing_ticker(self, mock_dl: MagicMock) -> None:
+        from clawdfolio.analysis.bubble import calc_credit_spread
+
+        mock_dl.return_value = _make_download_df(n=300)
         result = calc_credit_spread()
         assert result is None
 
@@ -5,9 +5,11 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from clawdfolio.analysis.bubble import (
     BubbleRiskResult,
+    _risk_regime,
     _sma200_deviation,
     _trend_acceleration,
     _volatility_regime,
@@ -16,6 +18,15 @@ from clawdfolio.analysis.bubble import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_fetch_cache():
+    from clawdfolio.analysis.bubble import _fetch_cache
+
+    _fetch_cache.clear()
+    yield
+    _fetch_cache.clear()
+
+
 class TestSma200Deviation:
     def test_normal_deviation(self):
         prices = pd.Series(np.linspace(100, 120, 250))
@@ -41,6 +52,12 @@ class TestTrendAcceleration:
         prices = pd.Series([100.0] * 10)
         assert _trend_acceleration(prices) == 0.0
 
+    def test_matches_polyfit(self):
+        np.random.seed(7)
+        prices = pd.Series(100 * np.exp(np.cumsum(np.random.normal(0.001, 0.02, 200))))
+        expected = np.polyfit(np.arange(60), np.log(prices.values[-60:]), 2)[0] * 10000
+        assert np.isclose(_trend_acceleration(prices), expected)
+
 
 class TestVolatilityRegime:
     def test_normal_vol(self):
@@ -53,15 +70,32 @@ class TestVolatilityRegime:
         prices = pd.Series([100.0] * 5)
         assert _volatility_regime(prices) == 0.5
 
+    def test_only_recent_window_counts(self):
+        np.random.seed(3)
+        recent = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 21)))
+        calm = pd.Series(np.concatenate([np.full(200, 100.0), recent]))
+        wild = pd.Series(np.concatenate([np.linspace(50, 150, 200), recent]))
+        expected = np.std(np.diff(np.log(recent))) * np.sqrt(252)
+        assert np.isclose(_volatility_regime(calm), expected)
+        assert np.isclose(_volatility_regime(wild), expected)
+
+
+class TestRiskRegime:
+    def test_boundaries(self):
+        assert _risk_regime(39.9) == "low_risk"
+        assert _risk_regime(40.0) == "moderate"
+        assert _risk_regime(55.0) == "elevated"
+        assert _risk_regime(65.9) == "elevated"
+        assert _risk_regime(66.0) == "high_risk"
+        assert _risk_regime(100.0) == "high_risk"
+
 
 class TestCalculateBubbleRisk:
     @patch("clawdfolio.analysis.bubble._safe_download")
-    @patch("clawdfolio.analysis.bubble._get_close")
-    def test_normal_calculation(self, mock_close, mock_download):
+    def test_normal_calculation(self, mock_download):
         np.random.seed(42)
         prices = pd.Series(100 * np.exp(np.cumsum(np.random.normal(0.001, 0.02, 300))))
         mock_download.return_value = pd.DataFrame({"Close": prices})
-        mock_close.return_value = prices
 
         result = calculate_bubble_risk("QQQ")
         assert isinstance(result, BubbleRiskResult)
@@ -70,20 +104,16 @@ class TestCalculateBubbleRisk:
         assert "sma200_deviation" in result.components
 
     @patch("clawdfolio.analysis.bubble._safe_download")
-    @patch("clawdfolio.analysis.bubble._get_close")
-    def test_insufficient_data_fallback(self, mock_close, mock_download):
+    def test_insufficient_data_fallback(self, mock_download):
         mock_download.return_value = pd.DataFrame({"Close": [100.0] * 50})
-        mock_close.return_value = pd.Series([100.0] * 50)
 
         result = calculate_bubble_risk("QQQ")
         assert result.drawdown_risk_score == 50.0
         assert result.regime == "moderate"
 
     @patch("clawdfolio.analysis.bubble._safe_download")
-    @patch("clawdfolio.analysis.bubble._get_close")
-    def test_empty_data(self, mock_close, mock_download):
+    def test_empty_data(self, mock_download):
         mock_download.return_value = pd.DataFrame()
-        mock_close.return_value = pd.Series(dtype=float)
 
         result = calculate_bubble_risk("QQQ")
         assert result.drawdown_risk_score == 50.0
@@ -113,6 +143,19 @@ class TestFetchBubbleRisk:
         assert result.regime == "high_risk"
         assert result.date == "2026-02-28"
 
+    @patch("urllib.request.urlopen")
+    def test_fetch_cached_for_the_day(self, mock_urlopen):
+        mock_data = {"history": [{"date": "2026-02-28", "drawdown_risk_score": 72.5}]}
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = json.dumps(mock_data).encode()
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        first = fetch_bubble_risk()
+        assert fetch_bubble_risk() is first
+        mock_urlopen.assert_called_once()
+
     @patch("urllib.request.urlopen")
     def test_fetch_low_risk(self, mock_urlopen):
         mock_data = {"history": [{"date": "2026-02-28", "drawdown_risk_score": 30.0, "composite_score": 25.0}]}
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from clawdfolio.cli.main import (
+    _peek_command,
     create_parser,
     main,
 )
@@ -88,6 +91,35 @@ class TestCreateParser:
         assert args.command == "quotes"
         assert args.symbols == ["AAPL", "GOOG"]
 
+    def test_parser_single_command(self):
+        parser = create_parser("quotes")
+        args = parser.parse_args(["--broker", "demo", "quotes", "AAPL"])
+        assert args.symbols == ["AAPL"]
+        with pytest.raises(SystemExit):
+            parser.parse_args(["risk"])
+
+    def test_every_subcommand_has_a_handler(self):
+        import clawdfolio.cli.main as cli_main
+
+        assert cli_main._COMMANDS.keys() == cli_main._SUBPARSER_BUILDERS.keys()
+        for name in cli_main._COMMANDS.values():
+            assert callable(getattr(cli_main, name))
+
+    def test_peek_command(self):
+        assert _peek_command(["--broker", "demo", "-o", "json", "alerts"]) == "alerts"
+        assert _peek_command(["--config=cfg.yml", "risk", "-d"]) == "risk"
+        assert _peek_command(["-h", "risk"]) is None
+        assert _peek_command([]) is None
+
+    def test_main_reuses_parser(self):
+        from clawdfolio.cli import main as cli_main
+
+        cli_main._parser_for.cache_clear()
+        with patch.object(cli_main, "create_parser", wraps=cli_main.create_parser) as build:
+            assert main(["--broker", "demo", "summary"]) == 0
+            assert main(["--broker", "demo", "-o", "json", "summary"]) == 0
+        assert build.call_count == 1
+
 
 class TestMainEntryPoint:
     """Tests for main() function."""
@@ -115,6 +147,14 @@ class TestMainEntryPoint:
         result = main(["--broker", "demo", "alerts"])
         assert result == 0
 
+    def test_main_loads_config_once(self):
+        from clawdfolio.core import config as config_module
+
+        with patch.object(config_module, "load_config", wraps=config_module.load_config) as load:
+            result = main(["--broker", "demo", "alerts"])
+        assert result == 0
+        assert load.call_count == 1
+
     def test_main_alerts_demo_json(self):
         result = main(["--broker", "demo", "-o", "json", "alerts"])
         assert result == 0
@@ -127,6 +167,18 @@ class TestMainEntryPoint:
         result = main(["--broker", "demo", "export", "portfolio", "--format", "json"])
         assert result == 0
 
+    def test_main_export_uses_selected_portfolio(self):
+        from clawdfolio.brokers import get_broker
+
+        demo = get_broker("demo")
+        demo.connect()
+        with patch(
+            "clawdfolio.cli.main._get_portfolio", return_value=demo.get_portfolio()
+        ) as get_portfolio:
+            result = main(["export", "portfolio"])
+        assert result == 0
+        assert get_portfolio.call_args.args[0].broker == "all"
+
     def test_main_export_risk_demo(self):
         result = main(["--broker", "demo", "export", "risk"])
         assert result == 0
@@ -204,6 +256,15 @@ class TestMainEntryPoint:
         result = main(["--broker", "all", "summary"])
         assert result in (0, 1)  # may fail if config tries real brokers
 
+    def test_main_all_broker_unknown_config_does_not_fall_back(self, tmp_path, capsys):
+        cfg = tmp_path / "config.json"
+        cfg.write_text('{"brokers": {"nosuch": {"enabled": true}}}')
+        result = main(["--config", str(cfg), "--broker", "all", "summary"])
+        assert result == 1
+        err = capsys.readouterr().err
+        assert "unknown broker 'nosuch'" in err
+        assert "No known broker configured: nosuch" in err
+
     def test_main_finance_no_subcommand_defaults_list(self):
         result = main(["finance"])
         assert result == 0
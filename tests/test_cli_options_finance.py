@@ -1,9 +1,16 @@
 """Tests for options and finance CLI commands."""
 
+import json
+import subprocess
+import sys
 from argparse import Namespace
 from unittest.mock import patch
 
+import pandas as pd
+import pytest
+
 from clawdfolio.cli.main import cmd_finance, cmd_options
+from clawdfolio.market.data import OptionChainData
 
 
 class TestCmdOptions:
@@ -55,6 +62,58 @@ class TestCmdOptions:
         result = cmd_options(args)
         assert result == 1
 
+    def test_options_non_chain_commands_skip_pandas(self):
+        code = (
+            "import sys; import clawdfolio.market.data as data; "
+            "data.get_option_expiries = lambda symbol: ['2024-03-15']; "
+            "from clawdfolio.cli.main import main; "
+            "main(['options', 'expiries', 'X']); main(['options', 'buyback']); "
+            "print('pandas' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip().splitlines()[-1] == "False"
+
+    def test_options_chain_json(self, capsys):
+        calls = pd.DataFrame(
+            {
+                "contractSymbol": ["C3", "C1", "C2"],
+                "strike": [3.0, 1.0, 2.0],
+                "bid": [0.1, 0.1 + 0.2, float("nan")],
+            }
+        )
+        chain = OptionChainData(ticker="TQQQ", expiry="2024-03-15", calls=calls, puts=pd.DataFrame())
+        args = Namespace(
+            output="json", options_command="chain", symbol="TQQQ",
+            expiry="2024-03-15", side="both", limit=2, config=None,
+        )
+        with patch("clawdfolio.market.data.get_option_chain", return_value=chain):
+            result = cmd_options(args)
+        assert result == 0
+        payload = json.loads(capsys.readouterr().out)
+        assert [row["contractSymbol"] for row in payload["calls"]] == ["C1", "C2"]
+        assert payload["calls"][0]["delta"] is None
+        assert payload["calls"][0]["bid"] == 0.1 + 0.2
+        assert payload["calls"][1]["bid"] is None
+        assert payload["puts"] == []
+
+    def test_options_chain_console(self, capsys):
+        calls = pd.DataFrame({"contractSymbol": ["C1"], "strike": [50.0], "bid": [1.25]})
+        chain = OptionChainData(ticker="TQQQ", expiry="2024-03-15", calls=calls, puts=pd.DataFrame())
+        args = Namespace(
+            output="console", options_command="chain", symbol="TQQQ",
+            expiry="2024-03-15", side="both", limit=10, config=None,
+        )
+        with patch("clawdfolio.market.data.get_option_chain", return_value=chain):
+            result = cmd_options(args)
+        assert result == 0
+        lines = capsys.readouterr().out.splitlines()
+        header = lines.index("Calls:") + 1
+        assert lines[header].split()[:3] == ["contractSymbol", "strike", "bid"]
+        assert lines[header + 1].split()[:4] == ["C1", "50", "1.25", "-"]
+        assert lines[-1] == "(empty)"
+
 
 class TestCmdFinance:
     """Tests for cmd_finance."""
@@ -75,6 +134,32 @@ class TestCmdFinance:
         result = cmd_finance(args)
         assert result == 0
 
+    def test_finance_list_unknown_category(self):
+        args = Namespace(
+            output="console", finance_command="list",
+            broker="demo", config=None, category="not_a_category",
+        )
+        result = cmd_finance(args)
+        assert result == 1
+
+    def test_other_commands_do_not_import_finance_catalog(self):
+        code = (
+            "import sys; from clawdfolio.cli.main import create_parser; "
+            "create_parser('summary'); print('clawdfolio.finance.workflows' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_finance_list_category_choices_in_parser(self, capsys):
+        from clawdfolio.cli.main import create_parser
+
+        with pytest.raises(SystemExit) as exc:
+            create_parser("finance").parse_args(["finance", "list", "--category", "bogus"])
+        assert exc.value.code == 2
+        assert "invalid choice" in capsys.readouterr().err
+
     def test_finance_unknown_subcommand(self):
         args = Namespace(
             output="console", finance_command="unknown_xyz",
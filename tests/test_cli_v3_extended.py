@@ -13,6 +13,7 @@ from clawdfolio.cli.main import (
     cmd_quotes,
     cmd_risk,
     cmd_summary,
+    create_parser,
     main,
 )
 from clawdfolio.core.types import Portfolio, Position, Quote, Symbol
@@ -51,6 +52,18 @@ class TestMainEntrypoint:
             main([])
             mock.assert_called_once()
 
+    def test_bare_invocation_skips_parser_with_same_defaults(self):
+        """Bare invocation builds the same namespace argparse would."""
+        with (
+            patch("clawdfolio.cli.main.create_parser") as mock_parser,
+            patch("clawdfolio.cli.main.cmd_summary", return_value=0) as mock,
+        ):
+            main([])
+        mock_parser.assert_not_called()
+        fast_args = vars(mock.call_args.args[0])
+        fast_args.pop("_config")
+        assert fast_args == vars(create_parser().parse_args(["summary"]))
+
     def test_version_flag(self):
         """Test --version flag."""
         with pytest.raises(SystemExit) as exc_info:
@@ -193,6 +206,28 @@ class TestCmdAlerts:
         result = cmd_alerts(args)
         assert result == 1
 
+    @patch("clawdfolio.notifications.send_notification")
+    def test_notification_message(self, mock_send):
+        from clawdfolio.cli.main import _send_alert_notifications
+        from clawdfolio.core.config import Config
+        from clawdfolio.core.types import Alert, AlertSeverity, AlertType
+
+        alerts = [
+            Alert(
+                type=AlertType.PRICE_MOVE,
+                severity=AlertSeverity.WARNING,
+                title=f"T{i}",
+                message=f"M{i}",
+            )
+            for i in range(2)
+        ]
+        args = Namespace(bot_token="tok", chat_id="1")
+        _send_alert_notifications(args, Config(), alerts, "telegram")
+        message = mock_send.call_args.args[2]
+        assert message == (
+            "Clawdfolio Alerts (2 triggered)\n\n[WARNING] T0\nM0\n\n[WARNING] T1\nM1\n"
+        )
+
 
 class TestCmdEarnings:
     """Tests for cmd_earnings."""
@@ -229,6 +264,46 @@ class TestCmdDca:
         assert result == 1
 
 
+class TestCmdCompare:
+    """Tests for cmd_compare."""
+
+    @staticmethod
+    def _rows():
+        from datetime import date
+
+        from clawdfolio.core.history import SnapshotRow
+
+        return [
+            SnapshotRow(date(2024, 1, 2), 110.0, 100.0, 10.0, 0.0, 0.0),
+            SnapshotRow(date(2024, 1, 1), 100.0, 90.0, 10.0, 0.0, 0.0),
+        ]
+
+    @patch("clawdfolio.market.data.get_history")
+    @patch("clawdfolio.core.history.read_snapshots")
+    def test_compare_skips_missing_closes(self, mock_rows, mock_hist, capsys):
+        import json
+
+        import pandas as pd
+
+        mock_rows.return_value = self._rows()
+        mock_hist.return_value = pd.DataFrame({"Close": [None, 200.0, 210.0, None]})
+        result = main(["--output", "json", "compare", "SPY", "--period", "all"])
+        assert result == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["portfolio_return_pct"] == 10.0
+        assert out["benchmark_return_pct"] == 5.0
+        assert out["alpha_pct"] == 5.0
+
+    @patch("clawdfolio.market.data.get_history")
+    @patch("clawdfolio.core.history.read_snapshots")
+    def test_compare_all_closes_missing(self, mock_rows, mock_hist):
+        import pandas as pd
+
+        mock_rows.return_value = self._rows()
+        mock_hist.return_value = pd.DataFrame({"Close": [None, None]}, dtype=float)
+        assert main(["compare", "SPY", "--period", "all"]) == 1
+
+
 class TestCmdHistoryExtended:
     """Extended history command tests."""
 
@@ -25,6 +25,7 @@ from clawdfolio.output.export import (
     export_portfolio_json,
     export_risk_csv,
     export_risk_json,
+    write_portfolio_csv,
 )
 
 
@@ -94,6 +95,13 @@ class TestExportPortfolioCSV:
         assert "market_value" in header
         assert "unrealized_pnl" in header
 
+    def test_write_to_file_matches_string_export(self, tmp_path):
+        portfolio = _make_portfolio()
+        path = tmp_path / "portfolio.csv"
+        with open(path, "w", encoding="utf-8", newline="") as fp:
+            write_portfolio_csv(portfolio, fp)
+        assert path.read_bytes().decode("utf-8") == export_portfolio_csv(portfolio)
+
 
 class TestExportRiskCSV:
     def test_basic_export(self):
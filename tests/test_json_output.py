@@ -1,5 +1,6 @@
 """Tests for JSON output formatting."""
 
+import io
 import json
 from datetime import datetime
 from decimal import Decimal
@@ -16,7 +17,7 @@ from clawdfolio.core.types import (
     RiskMetrics,
     Symbol,
 )
-from clawdfolio.output.json import CustomJSONEncoder, JSONFormatter, to_json
+from clawdfolio.output.json import CustomJSONEncoder, JSONFormatter, dump_json, to_json
 
 
 class TestCustomJSONEncoder:
@@ -131,3 +132,15 @@ class TestToJson:
     def test_custom_indent(self):
         result = to_json({"a": 1}, indent=4)
         assert "    " in result  # 4-space indent
+
+
+class TestDumpJson:
+    def test_matches_to_json(self):
+        obj = {"price": Decimal("99.99"), "ts": datetime(2024, 1, 2), "name": "ü"}
+        buf = io.StringIO()
+        dump_json(obj, buf)
+        assert buf.getvalue() == to_json(obj) + "\n"
+
+    def test_defaults_to_stdout(self, capsys):
+        dump_json({"a": 1})
+        assert capsys.readouterr().out == to_json({"a": 1}) + "\n"
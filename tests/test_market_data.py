@@ -101,3 +101,29 @@ def test_get_quote_prev_close_falls_back_to_history(monkeypatch):
     assert float(quote.price) == 103.0
     assert quote.prev_close is not None
     assert float(quote.prev_close) == 101.0
+
+
+def test_download_calls_do_not_overlap():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class _CountingYF:
+        def download(self, *_args, **_kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return pd.DataFrame()
+
+    yf = _CountingYF()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda t: market_data.download(yf, t), ["A", "B", "C", "D"]))
+    assert peak == 1